@@ -662,9 +662,13 @@ def main():
             'generated_at': datetime.utcnow().isoformat()
         }
         
+        # Stream the JSON to disk chunk by chunk instead of json.dump(), which
+        # would build the entire indented document in memory before writing.
+        encoder = json.JSONEncoder(indent=2, default=str)
         with open(filename, 'w') as f:
-            json.dump(output_data, f, indent=2, default=str)
-        
+            for chunk in encoder.iterencode(output_data):
+                f.write(chunk)
+
         print(f"\n💾 Data saved to: {filename}")
 
 if __name__ == "__main__":
@@ -1,8 +1,28 @@
+import functools
 import subprocess
 import json
 import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
 from simple_salesforce import Salesforce
 
+def _build_session():
+    """
+    Build a requests session with a keep-alive connection pool.
+
+    Passing this to Salesforce() makes every API call in the process
+    reuse the same TCP/TLS connection instead of paying a fresh
+    handshake per call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount('https://', adapter)
+    # Salesforce gzips responses on request; large SOQL payloads shrink
+    # several-fold on the wire and urllib3 decompresses transparently
+    session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+    return session
+
 def authenticate():
     """
     This will open a new tab and allow you to authenticate with Okta.
@@ -45,46 +65,64 @@ def get_token():
     except (json.JSONDecodeError, KeyError):
         return None, None
 
-def validate_token(access_token, instance_url):
+def validate_token(access_token, instance_url, session=None):
     """Check if the token is valid by attempting to connect"""
     try:
-        sf = Salesforce(instance_url=instance_url, session_id=access_token)
+        sf = Salesforce(instance_url=instance_url, session_id=access_token,
+                        session=session)
         # Try a simple query to verify the connection works
         sf.query("SELECT Id FROM User LIMIT 1")
         return True
     except Exception:
         return False
 
+# Guards the first authentication when several threads ask for the
+# connection at once
+_auth_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1)
 def get_salesforce_connection():
     """
     Get an authenticated Salesforce connection.
     Only authenticates if no valid token exists.
-    
+
+    The connection is cached for the life of the process, so batch and
+    worker callers that invoke this repeatedly skip the CLI token
+    lookup and validation round-trip. Call
+    get_salesforce_connection.cache_clear() to force a fresh login.
+
     Returns:
         Salesforce: An authenticated Salesforce connection object
     """
-    # Try to get existing token
-    access_token, instance_url = get_token()
-    
-    # If token exists, validate it
-    if access_token and instance_url:
-        if validate_token(access_token, instance_url):
-            print("Using existing valid token.")
-            return Salesforce(instance_url=instance_url, session_id=access_token)
+    with _auth_lock:
+        # One pooled session serves the validation probe and every API
+        # call made through the returned connection
+        session = _build_session()
+
+        # Try to get existing token
+        access_token, instance_url = get_token()
+
+        # If token exists, validate it
+        if access_token and instance_url:
+            if validate_token(access_token, instance_url, session=session):
+                print("Using existing valid token.")
+                return Salesforce(instance_url=instance_url, session_id=access_token,
+                                  session=session)
+            else:
+                print("Existing token is invalid. Re-authenticating...")
         else:
-            print("Existing token is invalid. Re-authenticating...")
-    else:
-        print("No existing token found. Authenticating...")
-    
-    # Authenticate and get new token
-    authenticate()
-    access_token, instance_url = get_token()
-    
-    if access_token and instance_url:
-        print("Connected!")
-        return Salesforce(instance_url=instance_url, session_id=access_token)
-    else:
-        raise Exception("Failed to retrieve token after authentication")
+            print("No existing token found. Authenticating...")
+
+        # Authenticate and get new token
+        authenticate()
+        access_token, instance_url = get_token()
+
+        if access_token and instance_url:
+            print("Connected!")
+            return Salesforce(instance_url=instance_url, session_id=access_token,
+                              session=session)
+        else:
+            raise Exception("Failed to retrieve token after authentication")
 
 if __name__ == "__main__":
     # Test the connection
@@ -12,89 +12,304 @@ Example:
     python sf_explore_json.py "https://elastic.lightning.force.com/lightning/r/Opportunity/0064R00000XXXXXX/view"
 """
 
+import argparse
 import sys
 import re
+import itertools
 import json
+import hashlib
 import logging
 import os
-from datetime import datetime
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Any
+from urllib.parse import quote
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from sf_auth import get_salesforce_connection
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Prefer orjson's native encoder for the large describe payloads; fall
+# back to stdlib json so this exploratory script still runs without it
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+
+    def _dumps_compact(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
+
+    def _dumps_compact(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), default=str).encode()
+
+# Configure logging only when no handler is installed, so importing
+# this module doesn't reconfigure the host application's logging
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
 logger = logging.getLogger(__name__)
 
+# Standard fields used by the basic projection
+_BASIC_FIELDS = (
+    'Id',
+    'Name',
+    'Account.Name',
+    'CloseDate',
+    'Amount',
+    'StageName',
+    'Type',
+    'CreatedDate',
+    'LastModifiedDate',
+    'Owner.Name'
+)
+
+# Curated ~20-field projection used by default: querying every column
+# (the SELECT FIELDS(ALL) anti-pattern) inflates the payload 5-10x with
+# long-text blobs that exploration rarely needs
+_CURATED_FIELDS = (
+    'Id',
+    'Name',
+    'AccountId',
+    'Account.Name',
+    'Amount',
+    'CloseDate',
+    'StageName',
+    'Type',
+    'Probability',
+    'ForecastCategoryName',
+    'LeadSource',
+    'NextStep',
+    'IsClosed',
+    'IsWon',
+    'HasOpportunityLineItem',
+    'CreatedDate',
+    'LastModifiedDate',
+    'OwnerId',
+    'Owner.Name'
+)
+
+# Field types excluded from the all-fields query and the relationship
+# fields added to it, hoisted so the query builder allocates neither
+_SKIP_FIELD_TYPES = frozenset({'base64'})
+_LONG_TEXT_TYPES = frozenset({'textarea', 'richtext'})
+_RELATIONSHIP_FIELDS = (
+    'Account.Name',
+    'Account.Id',
+    'Owner.Name',
+    'Owner.Id'
+)
+
+# Fields highlighted in the end-of-run summary
+_KEY_FIELDS = ('Id', 'Name', 'Account', 'Amount', 'CloseDate', 'StageName')
+
+# Patterns for Salesforce opportunity ID (15 or 18 characters starting
+# with 006), compiled once at import instead of on every call; IDs are
+# ASCII-only so re.ASCII skips Unicode lookups
+_OPP_ID_PATTERNS = tuple(re.compile(p, re.ASCII) for p in (
+    r'/([A-Za-z0-9]{15,18})',  # Generic ID pattern
+    r'/Opportunity/([A-Za-z0-9]{15,18})',  # Explicit opportunity pattern
+    r'006[A-Za-z0-9]{12,15}',  # Opportunity-specific pattern
+))
+
 def extract_opportunity_id(url: str) -> Optional[str]:
     """
     Extract Salesforce Opportunity ID from URL.
-    
+
     Args:
         url: Salesforce opportunity URL
-        
+
     Returns:
         Opportunity ID or None if not found
     """
-    # Pattern for Salesforce opportunity ID (15 or 18 characters starting with 006)
-    patterns = [
-        r'/([A-Za-z0-9]{15,18})',  # Generic ID pattern
-        r'/Opportunity/([A-Za-z0-9]{15,18})',  # Explicit opportunity pattern
-        r'006[A-Za-z0-9]{12,15}',  # Opportunity-specific pattern
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    # Fast path: Lightning URLs have a fixed '/Opportunity/<id>/' shape,
+    # so a find-and-slice avoids the regex engine entirely
+    i = url.find('/Opportunity/')
+    if i >= 0:
+        candidate = url[i + 13:].split('/', 1)[0].split('?', 1)[0]
+        if candidate.startswith('006') and len(candidate) in (15, 18) and candidate.isalnum():
+            return candidate
+
+    # Classic/other URL shapes: check each path segment for the ID
+    for segment in url.split('/'):
+        if segment.startswith('006') and len(segment) in (15, 18) and segment.isalnum():
+            return segment
+
+    # Last resort: the original regex scan for IDs embedded in odd URLs
+    for pattern in _OPP_ID_PATTERNS:
+        match = pattern.search(url)
         if match:
             opportunity_id = match.group(1) if len(match.groups()) > 0 else match.group(0)
             # Ensure it starts with 006 (Opportunity prefix)
             if opportunity_id.startswith('006') and len(opportunity_id) >= 15:
                 return opportunity_id
-    
-    logger.error(f"Could not extract opportunity ID from URL: {url}")
+
+    logger.error("Could not extract opportunity ID from URL: %s", url)
     return None
 
+# SOQL templates built once at import; the ID slot is filled after
+# validation and escaping below
+_SOQL_BASIC = (
+    f"SELECT {','.join(_BASIC_FIELDS)} FROM Opportunity WHERE Id = '{{}}'"
+)
+_SOQL_CURATED = (
+    f"SELECT {','.join(_CURATED_FIELDS)} FROM Opportunity WHERE Id = '{{}}'"
+)
+
+_SOQL_ID_RE = re.compile(r'[A-Za-z0-9]{15,18}', re.ASCII)
+
+def _escape_soql_id(opportunity_id: str) -> str:
+    """
+    Validate and escape a Salesforce ID before SOQL interpolation.
+
+    IDs that survive validation are alphanumeric, so escaping is a
+    belt-and-braces guard against malformed input reaching the query.
+    """
+    if not _SOQL_ID_RE.fullmatch(opportunity_id):
+        raise ValueError(f"Invalid Salesforce ID: {opportunity_id!r}")
+    return opportunity_id.replace('\\', '\\\\').replace("'", "\\'")
+
+@dataclass
+class DescribeView:
+    """Pre-digested view over an Opportunity describe payload."""
+    fields: Dict[str, Dict[str, Any]]
+    queryable_names: List[str]
+    custom_names: List[str]
+
+def _parse_describe(describe_result: Dict[str, Any]) -> DescribeView:
+    """
+    Extract field metadata, queryable names and custom names in one pass.
+
+    The metadata dict, the all-fields query list and the custom-field
+    summary each used to walk the ~200-field describe separately; fusing
+    them means one scan and one set of attribute lookups per field.
+    """
+    fields = {}
+    queryable_names = []
+    custom_names = []
+
+    for f in describe_result['fields']:
+        name = f['name']
+        ftype = f['type']
+        custom = f.get('custom', False)
+        queryable = f.get('queryable', False)
+
+        fields[name] = {
+            'label': f['label'],
+            'type': ftype,
+            'custom': custom,
+            'updateable': f.get('updateable', False),
+            'queryable': queryable
+        }
+        if (queryable and ftype not in _SKIP_FIELD_TYPES and '.' not in name
+                and not (f.get('calculated') and ftype in _LONG_TEXT_TYPES)):
+            queryable_names.append(name)
+        if custom:
+            custom_names.append(name)
+
+    return DescribeView(fields, queryable_names, custom_names)
+
+# In-process cache for the Opportunity describe payload, keyed by
+# session so a stale entry can't leak across re-authentications
+_DESCRIBE_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Parsed views of the cached payload, same keying
+_DESCRIBE_VIEW_CACHE: Dict[str, DescribeView] = {}
+
+def _get_describe_view(sf) -> DescribeView:
+    """Return the parsed describe view for this session, parsing once."""
+    key = sf.session_id
+    if key not in _DESCRIBE_VIEW_CACHE:
+        _DESCRIBE_VIEW_CACHE[key] = _parse_describe(_get_opportunity_describe(sf))
+    return _DESCRIBE_VIEW_CACHE[key]
+
+# Disk cache for the describe payload across runs; schema changes are
+# rare so re-runs of this exploratory script can skip the call entirely.
+# Opt-in via SF_DESCRIBE_CACHE=1.
+_DESCRIBE_CACHE_DIR = os.path.expanduser('~/.sf_explore_cache')
+
+def _describe_cache_path(instance_url: str) -> str:
+    """Cache file path, keyed by instance so orgs don't share entries."""
+    org_hash = hashlib.sha1(instance_url.encode()).hexdigest()[:12]
+    return os.path.join(_DESCRIBE_CACHE_DIR, f'opportunity_describe_{org_hash}.json')
+
+def _load_cached_describe(instance_url: str, ttl_seconds: int = 86400) -> Optional[Dict[str, Any]]:
+    """Load the describe payload from disk if present and within TTL."""
+    path = _describe_cache_path(instance_url)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_describe(instance_url: str, describe_result: Dict[str, Any]):
+    """Write the describe payload to the disk cache, best-effort."""
+    try:
+        os.makedirs(_DESCRIBE_CACHE_DIR, exist_ok=True)
+        with open(_describe_cache_path(instance_url), 'w') as f:
+            json.dump(describe_result, f)
+    except OSError as e:
+        logger.debug("Could not write describe cache: %s", e)
+
+def _get_opportunity_describe(sf) -> Dict[str, Any]:
+    """
+    Fetch the Opportunity describe metadata, memoized per session.
+
+    The describe payload is ~200 fields and stable within a run, so one
+    round-trip serves both the field summary and the all-fields query
+    instead of each making its own API call. With SF_DESCRIBE_CACHE=1 it
+    is also cached on disk for 24h, skipping the call across runs.
+    """
+    key = sf.session_id
+    if key not in _DESCRIBE_CACHE:
+        use_disk = os.environ.get('SF_DESCRIBE_CACHE') == '1'
+        instance_url = getattr(sf, 'sf_instance', '') or ''
+        cached = _load_cached_describe(instance_url) if use_disk else None
+        if cached is not None:
+            logger.info("Using cached Opportunity describe from disk")
+            _DESCRIBE_CACHE[key] = cached
+        else:
+            _DESCRIBE_CACHE[key] = sf.Opportunity.describe()
+            if use_disk:
+                _store_cached_describe(instance_url, dict(_DESCRIBE_CACHE[key]))
+    return _DESCRIBE_CACHE[key]
+
 def describe_opportunity_object(sf) -> Dict[str, Any]:
     """
     Get field descriptions for the Opportunity object.
-    
+
     Args:
         sf: Authenticated Salesforce connection
-        
+
     Returns:
         Dictionary with field information
     """
     try:
-        describe_result = sf.Opportunity.describe()
-        
-        # Extract field information
-        fields = {}
-        for field in describe_result['fields']:
-            fields[field['name']] = {
-                'label': field['label'],
-                'type': field['type'],
-                'custom': field.get('custom', False),
-                'updateable': field.get('updateable', False),
-                'queryable': field.get('queryable', False)
-            }
-        
+        describe_result = _get_opportunity_describe(sf)
+        view = _get_describe_view(sf)
+
         return {
             'object_info': {
                 'name': describe_result['name'],
                 'label': describe_result['label'],
                 'custom': describe_result.get('custom', False)
             },
-            'fields': fields
+            'fields': view.fields,
+            'custom_fields': view.custom_names
         }
-        
+
     except Exception as e:
-        logger.error(f"Error describing Opportunity object: {str(e)}")
+        logger.exception("Error describing Opportunity object: %s", e)
         return {}
 
 def query_opportunity_basic(sf, opportunity_id: str) -> Optional[Dict[str, Any]]:
@@ -110,37 +325,95 @@ def query_opportunity_basic(sf, opportunity_id: str) -> Optional[Dict[str, Any]]
     """
     try:
         # Basic SOQL query with standard fields only
-        soql_query = f"""
-        SELECT 
-            Id,
-            Name,
-            Account.Name,
-            CloseDate,
-            Amount,
-            StageName,
-            Type,
-            CreatedDate,
-            LastModifiedDate,
-            Owner.Name
-        FROM Opportunity 
-        WHERE Id = '{opportunity_id}'
-        """
-        
-        logger.info(f"Querying Salesforce for opportunity: {opportunity_id}")
+        soql_query = _SOQL_BASIC.format(_escape_soql_id(opportunity_id))
+
+        logger.info("Querying Salesforce for opportunity: %s", opportunity_id)
         result = sf.query(soql_query)
         
         if result['totalSize'] == 0:
-            logger.error(f"No opportunity found with ID: {opportunity_id}")
+            logger.error("No opportunity found with ID: %s", opportunity_id)
             return None
             
         opportunity = result['records'][0]
-        logger.info(f"Successfully retrieved opportunity: {opportunity['Name']}")
+        logger.info("Successfully retrieved opportunity: %s", opportunity['Name'])
         return opportunity
         
     except Exception as e:
-        logger.error(f"Error querying Salesforce: {str(e)}")
+        logger.exception("Error querying Salesforce: %s", e)
         return None
 
+def _explore_via_composite(sf, soql_query: str):
+    """
+    Fetch the Opportunity describe and a record query in one round-trip.
+
+    The Composite REST endpoint runs both sub-requests server-side, so a
+    fixed-projection exploration costs one HTTP call instead of two
+    sequential ones. Returns (describe_result, record) or None if the
+    composite call fails, letting the caller fall back to separate calls.
+    """
+    try:
+        version = sf.sf_version
+        body = {
+            'compositeRequest': [
+                {
+                    'method': 'GET',
+                    'url': f'/services/data/v{version}/sobjects/Opportunity/describe',
+                    'referenceId': 'describe'
+                },
+                {
+                    'method': 'GET',
+                    'url': f'/services/data/v{version}/query?q={quote(soql_query)}',
+                    'referenceId': 'query'
+                }
+            ]
+        }
+
+        result = sf.restful('composite', method='POST', json=body)
+        responses = {r['referenceId']: r for r in result['compositeResponse']}
+
+        if any(r['httpStatusCode'] != 200 for r in responses.values()):
+            logger.warning("Composite request returned a non-200 sub-response")
+            return None
+
+        records = responses['query']['body'].get('records', [])
+        if not records:
+            logger.error("No opportunity found via composite query")
+            return None
+
+        return responses['describe']['body'], records[0]
+
+    except Exception as e:
+        logger.warning("Composite request failed, using separate calls: %s", e)
+        return None
+
+def query_opportunity_curated(sf, opportunity_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Query Salesforce for a curated projection of useful opportunity fields.
+
+    Args:
+        sf: Authenticated Salesforce connection
+        opportunity_id: Salesforce opportunity ID
+
+    Returns:
+        Dictionary with opportunity data or None if not found
+    """
+    try:
+        soql_query = _SOQL_CURATED.format(_escape_soql_id(opportunity_id))
+
+        logger.info("Querying curated field set (%d fields)...", len(_CURATED_FIELDS))
+        result = sf.query(soql_query)
+
+        if result['totalSize'] == 0:
+            logger.error("No opportunity found with ID: %s", opportunity_id)
+            return None
+
+        return result['records'][0]
+
+    except Exception as e:
+        logger.exception("Error in curated query: %s", e)
+        logger.info("Falling back to basic field query...")
+        return query_opportunity_basic(sf, opportunity_id)
+
 def query_opportunity_all_fields(sf, opportunity_id: str) -> Optional[Dict[str, Any]]:
     """
     Query Salesforce for opportunity with all queryable fields.
@@ -153,61 +426,57 @@ def query_opportunity_all_fields(sf, opportunity_id: str) -> Optional[Dict[str,
         Dictionary with opportunity data or None if not found
     """
     try:
-        # Get field descriptions to build comprehensive query
-        describe_result = sf.Opportunity.describe()
-        
-        # Get all queryable fields
-        queryable_fields = []
-        for field in describe_result['fields']:
-            if field.get('queryable', False) and field['type'] not in ['base64']:
-                # Skip relationship fields that might cause issues
-                if '.' not in field['name']:
-                    queryable_fields.append(field['name'])
-        
-        # Add some common relationship fields manually
-        relationship_fields = [
-            'Account.Name',
-            'Account.Id', 
-            'Owner.Name',
-            'Owner.Id'
-        ]
-        
-        all_fields = queryable_fields + relationship_fields
-        fields_str = ',\n            '.join(all_fields)
-        
-        soql_query = f"""
-        SELECT 
-            {fields_str}
-        FROM Opportunity 
-        WHERE Id = '{opportunity_id}'
-        """
-        
-        logger.info(f"Querying with {len(all_fields)} fields...")
-        result = sf.query(soql_query)
-        
-        if result['totalSize'] == 0:
-            logger.error(f"No opportunity found with ID: {opportunity_id}")
+        # The describe view already holds the filtered queryable names
+        # (no relationship fields, no calculated long-text blobs), parsed
+        # once per session
+        queryable_fields = _get_describe_view(sf).queryable_names
+
+        # Plain comma-joined field list - the old multi-line formatting
+        # whitespace only inflated the request body
+        fields_str = ','.join(itertools.chain(queryable_fields, _RELATIONSHIP_FIELDS))
+
+        soql_query = (
+            f"SELECT {fields_str} FROM Opportunity "
+            f"WHERE Id = '{_escape_soql_id(opportunity_id)}'"
+        )
+
+        logger.info("Querying with %d fields...", len(queryable_fields) + len(_RELATIONSHIP_FIELDS))
+
+        # Walk the lazy nextRecordsUrl cursor and stop after the first
+        # record - constant memory even if the query ever matches more
+        # than one page, and no extra fetches for the single-record case
+        records = list(itertools.islice(sf.query_all_iter(soql_query), 1))
+
+        if not records:
+            logger.error("No opportunity found with ID: %s", opportunity_id)
             return None
-            
-        opportunity = result['records'][0]
-        logger.info(f"Successfully retrieved opportunity with all fields")
-        return opportunity
+
+        logger.info("Successfully retrieved opportunity with all fields")
+        return records[0]
         
     except Exception as e:
-        logger.error(f"Error in comprehensive query: {str(e)}")
+        logger.exception("Error in comprehensive query: %s", e)
         # Fall back to basic query
         logger.info("Falling back to basic field query...")
         return query_opportunity_basic(sf, opportunity_id)
 
 def main():
     """Main execution function."""
-    if len(sys.argv) != 2:
-        print("Usage: python sf_explore_json.py <opportunity_url>")
-        print("Example: python sf_explore_json.py 'https://elastic.lightning.force.com/lightning/r/Opportunity/0064R00000XXXXXX/view'")
-        sys.exit(1)
-    
-    opportunity_url = sys.argv[1]
-    logger.info(f"Exploring opportunity URL: {opportunity_url}")
+    parser = argparse.ArgumentParser(description="Explore a Salesforce opportunity as JSON")
+    parser.add_argument('opportunity_url',
+                        help="Salesforce opportunity URL "
+                             "(e.g. 'https://elastic.lightning.force.com/lightning/r/Opportunity/0064R00000XXXXXX/view')")
+    parser.add_argument('--mode', choices=('basic', 'curated', 'all'), default='curated',
+                        help="Field projection: basic standard fields, a curated "
+                             "~20-field set (default), or every queryable field")
+    parser.add_argument('--ndjson', action='store_true',
+                        help="Emit compact newline-delimited JSON (one line each for "
+                             "extraction info, field description and opportunity data) "
+                             "so downstream consumers can parse incrementally")
+
+    args = parser.parse_args()
+    opportunity_url = args.opportunity_url
+    logger.info("Exploring opportunity URL: %s", opportunity_url)
     
     # Step 1: Extract opportunity ID from URL
     opportunity_id = extract_opportunity_id(opportunity_url)
@@ -223,9 +492,37 @@ def main():
         logger.info("Successfully connected to Salesforce")
         print("✅ Connected to Salesforce")
     except Exception as e:
-        logger.error(f"Failed to connect to Salesforce: {str(e)}")
+        logger.exception("Failed to connect to Salesforce: %s", e)
         sys.exit(1)
     
+    # For fixed projections, fetch the describe and the record in one
+    # composite round-trip; 'all' mode needs the describe first to build
+    # its query, so it keeps the sequential path
+    opportunity_data = None
+    if args.mode != 'all':
+        template = _SOQL_BASIC if args.mode == 'basic' else _SOQL_CURATED
+        soql_query = template.format(_escape_soql_id(opportunity_id))
+        composite = _explore_via_composite(sf, soql_query)
+        if composite:
+            describe_result, opportunity_data = composite
+            # Seed the in-process cache so describe_opportunity_object
+            # formats the composite payload instead of re-fetching
+            _DESCRIBE_CACHE[sf.session_id] = describe_result
+        else:
+            # Composite unavailable: the describe and the record query
+            # are independent, so fire them concurrently - requests
+            # releases the GIL during I/O, making the wall-clock cost
+            # max() of the two latencies rather than their sum
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                describe_future = executor.submit(_get_opportunity_describe, sf)
+                query_future = executor.submit(sf.query, soql_query)
+                try:
+                    describe_future.result()
+                    records = query_future.result().get('records', [])
+                    opportunity_data = records[0] if records else None
+                except Exception as e:
+                    logger.warning("Concurrent describe/query failed: %s", e)
+
     # Step 3: Describe the Opportunity object
     print("\n📋 Describing Opportunity object...")
     describe_info = describe_opportunity_object(sf)
@@ -234,60 +531,97 @@ def main():
         print(f"   Object: {describe_info['object_info']['label']}")
         print(f"   Total fields: {len(describe_info['fields'])}")
         
-        # Show custom fields
-        custom_fields = [name for name, info in describe_info['fields'].items() if info.get('custom', False)]
+        # Show custom fields (collected during the single describe pass)
+        custom_fields = describe_info['custom_fields']
         if custom_fields:
             print(f"   Custom fields found: {len(custom_fields)}")
             print("   Custom field examples:", ', '.join(custom_fields[:5]))
         else:
             print("   No custom fields found")
     
-    # Step 4: Query opportunity data
-    print(f"\n📊 Querying opportunity data...")
-    
-    # Try comprehensive query first, fall back to basic if needed
-    opportunity_data = query_opportunity_all_fields(sf, opportunity_id)
+    # Step 4: Query opportunity data with the requested projection
+    # (unless the composite round-trip already returned it)
+    print(f"\n📊 Querying opportunity data ({args.mode} fields)...")
+
+    if opportunity_data is None:
+        if args.mode == 'all':
+            opportunity_data = query_opportunity_all_fields(sf, opportunity_id)
+        elif args.mode == 'basic':
+            opportunity_data = query_opportunity_basic(sf, opportunity_id)
+        else:
+            opportunity_data = query_opportunity_curated(sf, opportunity_id)
     
     if not opportunity_data:
         logger.error("Failed to retrieve opportunity data from Salesforce")
         sys.exit(1)
     
-    # Step 5: Output results
+    # Step 5: Output results - one clock read feeds both the metadata
+    # timestamp and the filename, so they can't drift apart
+    now = datetime.now(timezone.utc)
+    extracted_at = now.isoformat()
+
     output = {
         'extraction_info': {
             'opportunity_id': opportunity_id,
             'url': opportunity_url,
-            'extracted_at': datetime.utcnow().isoformat(),
+            'extracted_at': extracted_at,
             'source': 'salesforce'
         },
         'field_description': describe_info,
         'opportunity_data': opportunity_data
     }
     
-    # Pretty print JSON
+    # Serialize once and share the bytes between the console and the
+    # file - the old dumps-then-dump encoded the full structure twice.
+    # NDJSON mode writes the three sections as compact lines so
+    # downstream pipelines can parse them incrementally.
+    if args.ndjson:
+        encoded = b'\n'.join(
+            _dumps_compact(output[section])
+            for section in ('extraction_info', 'field_description', 'opportunity_data')
+        )
+        extension = 'ndjson'
+    else:
+        encoded = _dumps(output)
+        extension = 'json'
+
     print(f"\n🎯 Complete Opportunity Data:")
     print("=" * 60)
-    print(json.dumps(output, indent=2, default=str))
-    
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encoded)
+    sys.stdout.buffer.write(b'\n')
+
     # Also save to file
-    filename = f"opportunity_{opportunity_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(filename, 'w') as f:
-        json.dump(output, f, indent=2, default=str)
-    
+    filename = f"opportunity_{opportunity_id}_{now.strftime('%Y%m%d_%H%M%S')}.{extension}"
+    with open(filename, 'wb') as f:
+        f.write(encoded)
+
     print(f"\n💾 Data saved to: {filename}")
     
-    # Summary of key fields
+    # Summary of key fields - one .get per field instead of a
+    # membership check followed by a second lookup
     print(f"\n📈 Key Opportunity Fields:")
-    key_fields = ['Id', 'Name', 'Account', 'Amount', 'CloseDate', 'StageName']
-    for field in key_fields:
-        if field in opportunity_data:
-            value = opportunity_data[field]
-            if isinstance(value, dict) and 'Name' in value:
-                value = value['Name']  # For Account.Name
-            print(f"   {field}: {value}")
+    for field in _KEY_FIELDS:
+        value = opportunity_data.get(field)
+        if value is None:
+            continue
+        if isinstance(value, dict):
+            value = value.get('Name', value)  # For Account.Name
+        print(f"   {field}: {value}")
     
-    # Show available custom fields in this record
-    custom_data = {k: v for k, v in opportunity_data.items() if k.endswith('__c') and v is not None}
+    # Show available custom fields in this record - the describe pass
+    # already knows the custom names, so a C-level set intersection
+    # replaces an .endswith check per returned key
+    custom_names = frozenset(describe_info.get('custom_fields', ()))
+    if custom_names:
+        custom_data = {
+            k: opportunity_data[k]
+            for k in custom_names & opportunity_data.keys()
+            if opportunity_data[k] is not None
+        }
+    else:
+        custom_data = {k: v for k, v in opportunity_data.items()
+                       if k.endswith('__c') and v is not None}
     if custom_data:
         print(f"\n🔧 Custom Fields in this Opportunity:")
         for field, value in custom_data.items():
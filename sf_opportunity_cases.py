@@ -16,63 +16,136 @@ Examples:
 """
 
 import sys
+import csv
+import functools
+import io
 import json
 import re
 import os
+import time
 import argparse
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import numpy as np
+import orjson
 from sf_auth import get_salesforce_connection
 
+# Opportunity ID patterns, compiled once at import instead of per call
+_OPP_PATTERNS = tuple(re.compile(p) for p in (
+    r'/([A-Za-z0-9]{15,18})',
+    r'/Opportunity/([A-Za-z0-9]{15,18})',
+    r'(006[A-Za-z0-9]{12,15})',
+))
+
+# Bare-ID scanner for harvesting every opportunity ID from a URL file
+# in one C-level findall pass
+_OPP_ID_SCAN = re.compile(r'006[A-Za-z0-9]{12,15}')
+
+@functools.lru_cache(maxsize=4096)
 def extract_opportunity_id(url: str) -> Optional[str]:
-    """Extract Salesforce Opportunity ID from URL."""
-    patterns = [
-        r'/([A-Za-z0-9]{15,18})',
-        r'/Opportunity/([A-Za-z0-9]{15,18})',
-        r'006[A-Za-z0-9]{12,15}',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    """Extract Salesforce Opportunity ID from URL (memoized, since
+    URL files often repeat entries across invocations)."""
+    # Fast path: the input is already a raw ID
+    if url.startswith('006') and 15 <= len(url) <= 18:
+        return url
+
+    for pattern in _OPP_PATTERNS:
+        match = pattern.search(url)
         if match:
-            opp_id = match.group(1) if len(match.groups()) > 0 else match.group(0)
+            opp_id = match.group(1)
             if opp_id.startswith('006') and len(opp_id) >= 15:
                 return opp_id
-    
-    # Try as raw ID
-    if url.startswith('006') and 15 <= len(url) <= 18:
-        return url
-    
+
     return None
 
-def get_opportunities_info(sf, opportunity_ids: List[str]) -> Dict[str, Any]:
-    """Get opportunity information including account details."""
-    
+# Disk cache for opportunity/account lookups across invocations; an
+# opportunity's account assignment rarely changes, so nightly re-runs
+# over the same URL list can skip the resolution query entirely
+_OPP_CACHE_DIR = os.path.expanduser('~/.sf_cache/opps')
+
+def _opp_cache_path(opp_id: str) -> str:
+    return os.path.join(_OPP_CACHE_DIR, f'{opp_id}.json')
+
+def _load_cached_opp(opp_id: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
+    """Load one cached opportunity info dict if present and within TTL."""
+    path = _opp_cache_path(opp_id)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl_seconds:
+            return None
+        with open(path, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _store_cached_opps(opportunities: Dict[str, Dict[str, Any]]):
+    """Write opportunity info dicts to the disk cache, best-effort."""
+    try:
+        os.makedirs(_OPP_CACHE_DIR, exist_ok=True)
+        for opp_id, opp_info in opportunities.items():
+            with open(_opp_cache_path(opp_id), 'w') as f:
+                json.dump(opp_info, f)
+    except OSError:
+        pass
+
+def get_opportunities_info(sf, opportunity_ids: List[str],
+                           cache_ttl_seconds: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Get opportunity information including account details.
+
+    With cache_ttl_seconds set, fresh-enough entries are served from
+    the disk cache and only the misses are queried, eliminating the
+    resolution round-trip on the common "same opportunities, fresh
+    cases" path.
+    """
+
     if not opportunity_ids:
         return {}
-    
-    opp_ids_str = "','".join(opportunity_ids)
-    
+
+    opportunities_info = {}
+    account_ids = set()
+
+    missing = opportunity_ids
+    if cache_ttl_seconds:
+        missing = []
+        for opp_id in opportunity_ids:
+            cached = _load_cached_opp(opp_id, cache_ttl_seconds)
+            if cached:
+                opportunities_info[cached['id']] = cached
+                if cached.get('account_id'):
+                    account_ids.add(cached['account_id'])
+            else:
+                missing.append(opp_id)
+        if opportunities_info:
+            print(f"💾 Loaded {len(opportunities_info)} opportunity(ies) from cache")
+        if not missing:
+            return {
+                'opportunities': opportunities_info,
+                'account_ids': list(account_ids)
+            }
+
+    opp_ids_str = "','".join(missing)
+
     try:
         query = f"""
-        SELECT 
-            Id, Name, AccountId, Account.Name, Amount, StageName, 
+        SELECT
+            Id, Name, AccountId, Account.Name, Amount, StageName,
             CloseDate, IsWon, IsClosed, Owner.Name, CreatedDate
-        FROM Opportunity 
+        FROM Opportunity
         WHERE Id IN ('{opp_ids_str}')
         ORDER BY Name
         """
-        
+
         result = sf.query(query)
-        
-        opportunities_info = {}
-        account_ids = set()
-        
+
+        fresh = {}
+
         for record in result['records']:
             opp_info = {
                 'id': record['Id'],
@@ -87,126 +160,650 @@ def get_opportunities_info(sf, opportunity_ids: List[str]) -> Dict[str, Any]:
                 'owner': record['Owner']['Name'] if record.get('Owner') else None,
                 'created_date': record['CreatedDate']
             }
-            opportunities_info[record['Id']] = opp_info
-            
+            fresh[record['Id']] = opp_info
+
             if record['AccountId']:
                 account_ids.add(record['AccountId'])
-        
+
+        opportunities_info.update(fresh)
+        if cache_ttl_seconds and fresh:
+            _store_cached_opps(fresh)
+
         return {
             'opportunities': opportunities_info,
             'account_ids': list(account_ids)
         }
-        
+
     except Exception as e:
         print(f"❌ Error retrieving opportunity info: {str(e)}")
         return {'opportunities': {}, 'account_ids': []}
 
-def get_cases_for_accounts(sf, account_ids: List[str], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Get cases for the specified accounts (related to opportunities)."""
-    
-    if not account_ids:
-        return []
-    
-    account_ids_str = "','".join(account_ids)
-    
-    # Build WHERE clause
-    where_clauses = [f"AccountId IN ('{account_ids_str}')"]
-    
+def _load_accounts_file(path: str) -> Dict[str, Any]:
+    """
+    Read an opp_id,account_id,account_name CSV into opportunities_info.
+
+    Lets pipelines that analyze the same opportunity list repeatedly
+    skip the opportunity-resolution query entirely. Fields the mapping
+    doesn't carry (stage, amount, ...) are left empty - this mode is
+    for case-focused runs. Lines starting with '#' are ignored.
+    """
+    opportunities_info = {}
+    account_ids = set()
+
+    with open(path, newline='') as f:
+        for row in csv.reader(f):
+            if not row or row[0].lstrip().startswith('#'):
+                continue
+            opp_id = row[0].strip()
+            account_id = row[1].strip() if len(row) > 1 else None
+            if not opp_id or not account_id:
+                continue
+            opportunities_info[opp_id] = {
+                'id': opp_id,
+                'name': opp_id,
+                'account_id': account_id,
+                'account_name': row[2].strip() if len(row) > 2 else None,
+                'amount': None,
+                'stage': None,
+                'close_date': None,
+                'is_won': False,
+                'is_closed': False,
+                'owner': None,
+                'created_date': None
+            }
+            account_ids.add(account_id)
+
+    return {'opportunities': opportunities_info, 'account_ids': list(account_ids)}
+
+def _dump_accounts_file(path: str, opportunities_info: Dict[str, Any]):
+    """Write the opp_id,account_id,account_name CSV for --accounts-file."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        for opp in opportunities_info.get('opportunities', {}).values():
+            writer.writerow([opp['id'], opp['account_id'], opp['account_name'] or ''])
+    print(f"💾 Account mapping saved to: {path}")
+
+def chunked_in(field: str, ids: List[str], size: int = 500):
+    """
+    Yield `field IN (...)` clauses over slices of the ID list.
+
+    Keeps each generated SOQL comfortably under the query length limit
+    when --file expands to hundreds of opportunities and accounts.
+    """
+    for i in range(0, len(ids), size):
+        yield f"{field} IN ('" + "','".join(ids[i:i + size]) + "')"
+
+def _case_filter_clauses(filters: Dict[str, Any]) -> List[str]:
+    """Build the case WHERE clauses (excluding the account scope)."""
+    clauses = []
+
     if filters.get('open_only'):
-        where_clauses.append("IsClosed = false")
+        clauses.append("IsClosed = false")
     elif filters.get('closed_only'):
-        where_clauses.append("IsClosed = true")
-    
+        clauses.append("IsClosed = true")
+
     if filters.get('priority'):
-        where_clauses.append(f"Priority = '{filters['priority']}'")
-    
+        clauses.append(f"Priority = '{filters['priority']}'")
+
     if filters.get('status'):
-        where_clauses.append(f"Status = '{filters['status']}'")
-    
+        clauses.append(f"Status = '{filters['status']}'")
+
     if filters.get('type'):
-        where_clauses.append(f"Type = '{filters['type']}'")
-    
+        clauses.append(f"Type = '{filters['type']}'")
+
     if filters.get('date_from'):
-        where_clauses.append(f"CreatedDate >= {filters['date_from']}")
-    
+        clauses.append(f"CreatedDate >= {filters['date_from']}")
+
     if filters.get('date_to'):
-        where_clauses.append(f"CreatedDate <= {filters['date_to']}")
-    
-    where_clause = " AND ".join(where_clauses)
-    
+        clauses.append(f"CreatedDate <= {filters['date_to']}")
+
+    return clauses
+
+# Child subquery that pulls each case's comments inline with the case
+# itself - one round-trip instead of a follow-up CaseComment query,
+# with the outer WHERE bounding the parents automatically
+_COMMENT_SUBQUERY = (
+    "(SELECT Id, CommentBody, IsPublished, CreatedDate, "
+    "CreatedBy.Name, CreatedBy.Email FROM CaseComments)"
+)
+
+def _peel_comments(record: Dict[str, Any], comments_out: Dict[str, Any],
+                   keep_bodies: bool) -> bool:
+    """Move a record's inline CaseComments into the comments dict.
+
+    Stores full comment dicts when bodies were requested, otherwise
+    just the count - the analysis only ever needs the tally. Returns
+    False when the inline subquery was paginated (done is false) - the
+    first page is all Salesforce inlines, so the caller must fetch that
+    case's comments through the standalone CaseComment query instead.
+    """
+    sub = record.get('CaseComments') or {}
+    if not sub.get('done', True):
+        return False
+    rows = sub.get('records', [])
+    if not rows:
+        return True
+    if keep_bodies:
+        comments_out[record['Id']] = [
+            {
+                'id': comment['Id'],
+                'body': comment['CommentBody'],
+                'is_published': comment['IsPublished'],
+                'created_date': comment['CreatedDate'],
+                'created_by': comment['CreatedBy']['Name'] if comment.get('CreatedBy') else None,
+                'created_by_email': comment['CreatedBy']['Email'] if comment.get('CreatedBy') else None
+            }
+            for comment in rows
+        ]
+    else:
+        comments_out[record['Id']] = len(rows)
+    return True
+
+def get_opportunities_and_cases(sf, opportunity_ids: List[str],
+                                filters: Dict[str, Any]):
+    """
+    Fetch opportunities, accounts and related cases in one round-trip.
+
+    An Account-rooted query with Opportunities and Cases child
+    subqueries collapses the get_opportunities_info +
+    get_cases_for_accounts pair into a single SOQL call and dedupes the
+    account set server-side. Comments can't ride along here - SOQL only
+    allows one level of parent-to-child nesting, and the Cases subquery
+    already uses it. Returns (opportunities_info, cases) in the same
+    shapes as the two-step flow, or None if the combined query fails so
+    the caller can fall back to the separate calls.
+    """
+    if not opportunity_ids:
+        return None
+
+    opp_ids_str = "','".join(opportunity_ids)
+
+    case_sub = (
+        "SELECT Id, CaseNumber, Subject, "
+        + ("Description, " if filters.get('include_descriptions') else "")
+        + "Status, Priority, Type, Origin, "
+        "AccountId, ContactId, Contact.Name, Contact.Email, "
+        "CreatedDate, ClosedDate, IsClosed, "
+        "Owner.Name, Owner.Id, Owner.Email, "
+        "LastModifiedDate, LastModifiedBy.Name, Reason "
+        "FROM Cases"
+    )
+    case_where = " AND ".join(_case_filter_clauses(filters))
+    if case_where:
+        case_sub += f" WHERE {case_where}"
+    case_sub += " ORDER BY CreatedDate DESC"
+    if filters.get('limit'):
+        case_sub += f" LIMIT {filters['limit']}"
+
+    query = f"""
+    SELECT Id, Name,
+        (SELECT Id, Name, AccountId, Amount, StageName, CloseDate,
+                IsWon, IsClosed, Owner.Name, CreatedDate
+         FROM Opportunities WHERE Id IN ('{opp_ids_str}')),
+        ({case_sub})
+    FROM Account
+    WHERE Id IN (SELECT AccountId FROM Opportunity WHERE Id IN ('{opp_ids_str}'))
+    """
+
+    opportunities_info = {}
+    account_ids = []
+    cases = []
+    truncated_accounts = []
+
     try:
-        query = f"""
-        SELECT 
-            Id, CaseNumber, Subject, Description, Status, Priority, Type, Origin,
-            AccountId, Account.Name, ContactId, Contact.Name, Contact.Email,
-            CreatedDate, ClosedDate, IsClosed, 
-            Owner.Name, Owner.Id, Owner.Email,
-            LastModifiedDate, LastModifiedBy.Name,
-            Reason
-        FROM Case 
-        WHERE {where_clause}
-        ORDER BY Account.Name, CreatedDate DESC
-        """
-        
-        if filters.get('limit'):
-            query += f" LIMIT {filters['limit']}"
-        
+        print(f"🔍 Querying opportunities and cases in one combined call...")
+        # query_all_iter pulls pages lazily, so accounts are unpacked as
+        # they arrive instead of buffering the whole result list first
+        for account in sf.query_all_iter(query):
+            account_ids.append(account['Id'])
+            account_ref = {'Name': account['Name']}
+
+            for record in (account.get('Opportunities') or {}).get('records', []):
+                opportunities_info[record['Id']] = {
+                    'id': record['Id'],
+                    'name': record['Name'],
+                    'account_id': account['Id'],
+                    'account_name': account['Name'],
+                    'amount': record.get('Amount'),
+                    'stage': record['StageName'],
+                    'close_date': record.get('CloseDate'),
+                    'is_won': record.get('IsWon', False),
+                    'is_closed': record.get('IsClosed', False),
+                    'owner': record['Owner']['Name'] if record.get('Owner') else None,
+                    'created_date': record['CreatedDate']
+                }
+
+            cases_result = account.get('Cases') or {}
+            if not cases_result.get('done', True):
+                # Salesforce pages child subqueries independently
+                # (~200 records per parent) and query_all_iter only
+                # follows the outer cursor - keeping the partial page
+                # would silently drop this account's remaining cases,
+                # so refetch the whole account below instead
+                truncated_accounts.append(account['Id'])
+                continue
+            for case in cases_result.get('records', []):
+                # Subquery records don't carry Account.Name; patch it in
+                # so the case shape matches the standalone query
+                case.setdefault('Account', account_ref)
+                cases.append(_to_case_row(case))
+    except Exception as e:
+        print(f"⚠️  Combined query failed, falling back to separate calls: {str(e)}")
+        return None
+
+    if not opportunities_info:
+        return None
+
+    if truncated_accounts:
+        print(f"🔍 Refetching {len(truncated_accounts)} accounts whose "
+              f"case subquery was truncated...")
+        # Comments stay off here - they can't ride along in this query
+        # either, and the caller fetches them separately regardless
+        extra_cases, _ = get_cases_for_accounts(
+            sf, truncated_accounts, {**filters, 'include_comments': False})
+        cases.extend(extra_cases)
+
+    print(f"📋 Found {len(cases)} cases")
+    return {'opportunities': opportunities_info, 'account_ids': account_ids}, cases
+
+@dataclass(slots=True)
+class CaseRow:
+    """
+    Flat per-case record used throughout the analysis.
+
+    The raw simple_salesforce OrderedDicts carry an 'attributes' blob
+    and nested relationship dicts, costing well over a kilobyte per
+    case; flattening to slots at ingest cuts that to a fixed set of
+    slot references and turns dict hashing into offset lookups.
+    """
+    id: str
+    case_number: Optional[str]
+    subject: Optional[str]
+    status: Optional[str]
+    priority: Optional[str]
+    type: Optional[str]
+    origin: Optional[str]
+    account_id: Optional[str]
+    account_name: Optional[str]
+    contact_name: Optional[str]
+    contact_email: Optional[str]
+    created_date: Optional[str]
+    closed_date: Optional[str]
+    is_closed: bool
+    owner_name: Optional[str]
+    owner_email: Optional[str]
+    last_modified_date: Optional[str]
+    reason: Optional[str]
+    description: Optional[str] = None
+
+def _to_case_row(record: Dict[str, Any]) -> CaseRow:
+    """Flatten one raw case record into a CaseRow, hoisting nested names."""
+    account = record.get('Account') or {}
+    contact = record.get('Contact') or {}
+    owner = record.get('Owner') or {}
+    return CaseRow(
+        id=record['Id'],
+        case_number=record.get('CaseNumber'),
+        subject=record.get('Subject'),
+        status=record.get('Status'),
+        priority=record.get('Priority'),
+        type=record.get('Type'),
+        origin=record.get('Origin'),
+        account_id=record.get('AccountId'),
+        account_name=account.get('Name'),
+        contact_name=contact.get('Name'),
+        contact_email=contact.get('Email'),
+        created_date=record.get('CreatedDate'),
+        closed_date=record.get('ClosedDate'),
+        is_closed=bool(record.get('IsClosed')),
+        owner_name=owner.get('Name'),
+        owner_email=owner.get('Email'),
+        last_modified_date=record.get('LastModifiedDate'),
+        reason=record.get('Reason'),
+        description=record.get('Description')
+    )
+
+def _bulk_rows_to_records(csv_chunks) -> List[Dict[str, Any]]:
+    """
+    Convert Bulk API 2.0 CSV chunks into REST-shaped case dicts.
+
+    Relationship columns like 'Account.Name' are re-nested under their
+    parent key and IsClosed is coerced back to bool, so downstream
+    analysis consumes the same shape as sf.query_all records.
+    """
+    records = []
+    for chunk in csv_chunks:
+        for row in csv.DictReader(io.StringIO(chunk)):
+            record: Dict[str, Any] = {}
+            for key, value in row.items():
+                if value == '':
+                    value = None
+                if '.' in key:
+                    parent, child = key.split('.', 1)
+                    if record.get(parent) is None:
+                        record[parent] = {}
+                    record[parent][child] = value
+                else:
+                    record[key] = value
+            record['IsClosed'] = record.get('IsClosed') in (True, 'true', 'True')
+            records.append(record)
+    return records
+
+def get_cases_for_accounts(sf, account_ids: List[str], filters: Dict[str, Any],
+                           use_bulk: bool = False):
+    """
+    Get cases for the specified accounts (related to opportunities).
+
+    Returns (cases, case_comments). On the REST path comments arrive
+    inline via a CaseComments child subquery, so no follow-up
+    CaseComment query is needed; the Bulk API can't run subqueries, so
+    on that path case_comments is None and the caller fetches them
+    separately.
+    """
+
+    if not account_ids:
+        return [], {}
+
+    # Hoist the filter clauses once; only the account IN-list varies
+    # between chunks
+    filter_clauses = _case_filter_clauses(filters)
+    limit = filters.get('limit')
+
+    try:
+        records = []
         print(f"🔍 Querying cases for opportunity-related accounts...")
-        result = sf.query_all(query)
-        
-        print(f"📋 Found {result['totalSize']} cases")
-        return result['records']
-        
+
+        # Chunk the account IN-list so queries from large --file runs
+        # stay under the SOQL length limit; one query_all per chunk
+        # Description is a long-text field the analysis never renders;
+        # omitting it by default shrinks each API page substantially
+        description_field = "Description, " if filters.get('include_descriptions') else ""
+
+        # Comments ride along as an inline child subquery on the REST
+        # path; Bulk API 2.0 queries can't contain subqueries
+        include_comments = filters.get('include_comments') and not use_bulk
+        comments_field = f", {_COMMENT_SUBQUERY}" if include_comments else ""
+        keep_bodies = filters.get('include_comment_bodies', False)
+        case_comments: Optional[Dict[str, Any]] = {} if include_comments else None
+        truncated_comment_ids: List[str] = []
+
+        for in_clause in chunked_in('AccountId', account_ids):
+            where_clause = " AND ".join([in_clause] + filter_clauses)
+
+            query = f"""
+            SELECT
+                Id, CaseNumber, Subject, {description_field}Status, Priority, Type, Origin,
+                AccountId, Account.Name, ContactId, Contact.Name, Contact.Email,
+                CreatedDate, ClosedDate, IsClosed,
+                Owner.Name, Owner.Id, Owner.Email,
+                LastModifiedDate, LastModifiedBy.Name,
+                Reason{comments_field}
+            FROM Case
+            WHERE {where_clause}
+            ORDER BY Account.Name, CreatedDate DESC
+            """
+
+            if limit:
+                query += f" LIMIT {limit}"
+
+            # Large pulls go through Bulk API 2.0: one job streams CSV in
+            # ~10k-row chunks instead of dozens of 2,000-record REST
+            # pages, which keeps wide Case rows out of one giant JSON
+            # buffer
+            if use_bulk and not limit:
+                try:
+                    print(f"🔍 Querying cases via Bulk API 2.0...")
+                    results = sf.bulk2.Case.query(query, max_records=100000)
+                    records.extend(map(_to_case_row, _bulk_rows_to_records(results)))
+                    continue
+                except Exception as e:
+                    print(f"⚠️  Bulk query failed, falling back to REST: {str(e)}")
+
+            # Stream pages into the one result list instead of letting
+            # query_all materialize its own full copy first - peak
+            # memory drops from two full result sets to one. Each raw
+            # record is flattened to a CaseRow as it's iterated, so the
+            # heavyweight OrderedDicts never accumulate
+            if include_comments:
+                for record in sf.query_all_iter(query):
+                    if not _peel_comments(record, case_comments, keep_bodies):
+                        truncated_comment_ids.append(record['Id'])
+                    records.append(_to_case_row(record))
+            else:
+                records.extend(map(_to_case_row, sf.query_all_iter(query)))
+
+        if truncated_comment_ids:
+            # Cases with more comments than one inline child page; the
+            # standalone CaseComment query covers them completely
+            print(f"💬 Refetching comments for {len(truncated_comment_ids)} "
+                  f"cases whose inline comments were truncated...")
+            case_comments.update(get_case_comments(
+                sf, truncated_comment_ids, include_bodies=keep_bodies))
+
+        # A per-chunk LIMIT can overshoot the requested total
+        if limit:
+            records = records[:limit]
+
+        print(f"📋 Found {len(records)} cases")
+        return records, case_comments
+
     except Exception as e:
         print(f"❌ Error querying cases: {str(e)}")
-        return []
+        return [], {}
 
-def get_case_comments(sf, case_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
-    """Get comments for the specified cases."""
-    
-    if not case_ids:
+def get_case_stats_for_accounts(sf, account_ids: List[str],
+                                filters: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compute per-account case statistics server-side with GROUP BY.
+
+    Four grouped aggregate queries (Priority, Status, Type, IsClosed)
+    return a few dozen count rows instead of every Case record, so the
+    stats-only path transfers orders of magnitude less data than
+    downloading rows just to tally them locally. Returns a dict keyed
+    by account ID in the same shape as the acct_stats accumulator in
+    analyze_opportunity_cases.
+    """
+    if not account_ids:
         return {}
-    
-    # Limit to prevent too large queries
-    if len(case_ids) > 100:
-        print(f"⚠️  Limiting case comments query to first 100 cases")
-        case_ids = case_ids[:100]
-    
-    case_ids_str = "','".join(case_ids)
-    
+
+    filter_clauses = _case_filter_clauses(filters)
+
+    acct_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+        'open': 0,
+        'closed': 0,
+        'comments': 0,
+        'priorities': Counter(),
+        'statuses': Counter(),
+        'types': Counter()
+    })
+
     try:
+        print(f"🔍 Querying aggregated case statistics...")
+
+        for in_clause in chunked_in('AccountId', account_ids):
+            where_clause = " AND ".join([in_clause] + filter_clauses)
+
+            for field, counter_key in (('Priority', 'priorities'),
+                                       ('Status', 'statuses'),
+                                       ('Type', 'types')):
+                query = (
+                    f"SELECT AccountId, {field}, COUNT(Id) cnt FROM Case "
+                    f"WHERE {where_clause} GROUP BY AccountId, {field}"
+                )
+                for row in sf.query_all(query)['records']:
+                    value = row.get(field) or 'None'
+                    acct_stats[row['AccountId']][counter_key][value] += row['cnt']
+
+            query = (
+                "SELECT AccountId, IsClosed, COUNT(Id) cnt FROM Case "
+                f"WHERE {where_clause} GROUP BY AccountId, IsClosed"
+            )
+            for row in sf.query_all(query)['records']:
+                key = 'closed' if row['IsClosed'] else 'open'
+                acct_stats[row['AccountId']][key] += row['cnt']
+
+        total = sum(s['open'] + s['closed'] for s in acct_stats.values())
+        print(f"📋 Aggregated {total} cases across {len(acct_stats)} accounts")
+        return dict(acct_stats)
+
+    except Exception as e:
+        print(f"❌ Error querying case statistics: {str(e)}")
+        return {}
+
+def analyze_from_stats(opportunities_info: Dict[str, Any],
+                       acct_stats: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the analysis dict straight from server-side aggregates.
+
+    Mirrors the analyze_opportunity_cases output shape so
+    display_analysis and save_to_json work unchanged; row-derived
+    fields (recent cases, case ages, comment counts) are empty since
+    no rows were fetched.
+    """
+    opportunities = opportunities_info.get('opportunities', {})
+
+    by_opportunity = {}
+    for opp_id, opp_info in opportunities.items():
+        stats = acct_stats.get(opp_info['account_id'])
+        if stats:
+            account_total = stats['open'] + stats['closed']
+            priorities, statuses, types = (stats['priorities'],
+                                           stats['statuses'], stats['types'])
+        else:
+            account_total = 0
+            priorities = statuses = types = Counter()
+
+        by_opportunity[opp_id] = {
+            'opportunity_info': opp_info,
+            'case_ids': [],
+            'recent_cases': [],
+            'stats': {
+                'total_cases': account_total,
+                'open_cases': stats['open'] if stats else 0,
+                'closed_cases': stats['closed'] if stats else 0,
+                'close_rate': (stats['closed'] / account_total * 100) if stats and account_total else 0,
+                'total_comments': 0,
+                'avg_case_age_days': 0,
+                'priorities': dict(priorities),
+                'statuses': dict(statuses),
+                'types': dict(types)
+            }
+        }
+
+    total_cases = sum(s['open'] + s['closed'] for s in acct_stats.values())
+    open_cases = sum(s['open'] for s in acct_stats.values())
+    closed_cases = total_cases - open_cases
+
+    all_priorities = Counter()
+    all_statuses = Counter()
+    all_types = Counter()
+    for stats in acct_stats.values():
+        all_priorities.update(stats['priorities'])
+        all_statuses.update(stats['statuses'])
+        all_types.update(stats['types'])
+
+    return {
+        'total_cases': total_cases,
+        'total_opportunities': len(opportunities),
+        'by_opportunity': by_opportunity,
+        'overall_stats': {
+            'total_cases': total_cases,
+            'open_cases': open_cases,
+            'closed_cases': closed_cases,
+            'close_rate': (closed_cases / total_cases * 100) if total_cases > 0 else 0,
+            'total_comments': 0,
+            'avg_comments_per_case': 0,
+            'priority_breakdown': dict(all_priorities),
+            'status_breakdown': dict(all_statuses),
+            'type_breakdown': dict(all_types)
+        }
+    }
+
+def _comment_count(value) -> int:
+    """Comment payloads are lists when bodies were fetched, ints otherwise."""
+    return len(value) if isinstance(value, (list, tuple)) else int(value)
+
+def get_case_comments(sf, case_ids: List[str], chunk_size: int = 200,
+                      include_bodies: bool = False,
+                      max_workers: int = 8) -> Dict[str, Any]:
+    """
+    Get comments for the specified cases, chunking the IN-list.
+
+    By default only per-case counts are fetched via a GROUP BY
+    aggregate - the analysis never renders comment bodies, and skipping
+    them cuts the transfer by the average body size. With
+    include_bodies=True the full comment dicts are returned instead.
+    """
+    if not case_ids:
+        return {}
+
+    # Chunked IN-lists keep each SOQL under the 20k-character governor
+    # limit and cover every case - the old version silently truncated
+    # to the first 100 IDs, skewing the comment totals. The chunks are
+    # independent, so they're fetched concurrently; requests releases
+    # the GIL during I/O, making this purely network-parallel.
+    chunks = [case_ids[i:i + chunk_size] for i in range(0, len(case_ids), chunk_size)]
+    workers = min(max_workers, len(chunks))
+
+    if not include_bodies:
+        def fetch_counts(chunk):
+            case_ids_str = "','".join(chunk)
+            query = (
+                "SELECT ParentId, COUNT(Id) cnt FROM CaseComment "
+                f"WHERE ParentId IN ('{case_ids_str}') GROUP BY ParentId"
+            )
+            return sf.query_all(query)['records']
+
+        counts: Dict[str, int] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for rows in executor.map(fetch_counts, chunks):
+                    for row in rows:
+                        counts[row['ParentId']] = row['cnt']
+
+            print(f"💬 Retrieved comment counts for {len(counts)} cases")
+            return counts
+        except Exception as e:
+            print(f"⚠️  Error retrieving comment counts: {str(e)}")
+            return {}
+
+    def fetch_comments(chunk):
+        case_ids_str = "','".join(chunk)
         query = f"""
-        SELECT 
-            Id, ParentId, CommentBody, IsPublished, 
+        SELECT
+            Id, ParentId, CommentBody, IsPublished,
             CreatedDate, CreatedBy.Name, CreatedBy.Email
-        FROM CaseComment 
+        FROM CaseComment
         WHERE ParentId IN ('{case_ids_str}')
         ORDER BY ParentId, CreatedDate ASC
         """
-        
-        result = sf.query_all(query)
-        
-        # Group comments by case
-        comments_by_case = defaultdict(list)
-        for comment in result['records']:
-            case_id = comment['ParentId']
-            comments_by_case[case_id].append({
-                'id': comment['Id'],
-                'body': comment['CommentBody'],
-                'is_published': comment['IsPublished'],
-                'created_date': comment['CreatedDate'],
-                'created_by': comment['CreatedBy']['Name'] if comment.get('CreatedBy') else None,
-                'created_by_email': comment['CreatedBy']['Email'] if comment.get('CreatedBy') else None
-            })
-        
+        return sf.query_all(query)['records']
+
+    comments_by_case = defaultdict(list)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for records in executor.map(fetch_comments, chunks):
+                # Group comments by case
+                for comment in records:
+                    case_id = comment['ParentId']
+                    comments_by_case[case_id].append({
+                        'id': comment['Id'],
+                        'body': comment['CommentBody'],
+                        'is_published': comment['IsPublished'],
+                        'created_date': comment['CreatedDate'],
+                        'created_by': comment['CreatedBy']['Name'] if comment.get('CreatedBy') else None,
+                        'created_by_email': comment['CreatedBy']['Email'] if comment.get('CreatedBy') else None
+                    })
+
         print(f"💬 Retrieved comments for {len(comments_by_case)} cases")
         return dict(comments_by_case)
-        
+
     except Exception as e:
         print(f"⚠️  Error retrieving case comments: {str(e)}")
         return {}
 
-def analyze_opportunity_cases(opportunities_info: Dict[str, Any], cases: List[Dict[str, Any]], 
+def analyze_opportunity_cases(opportunities_info: Dict[str, Any], cases: List[CaseRow],
                             case_comments: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
     """Analyze cases related to opportunities."""
     
@@ -223,56 +820,123 @@ def analyze_opportunity_cases(opportunities_info: Dict[str, Any], cases: List[Di
         }
     
     opportunities = opportunities_info.get('opportunities', {})
-    
-    # Overall stats
+
+    # Overall stats. IsClosed is packed into a bool array once and
+    # counted with count_nonzero - a C kernel over one byte per case
+    # versus a Python-level dict lookup and truthiness test per record.
     total_cases = len(cases)
-    open_cases = sum(1 for case in cases if not case['IsClosed'])
-    closed_cases = total_cases - open_cases
-    total_comments = sum(len(comments) for comments in case_comments.values())
-    
-    # Group cases by account, then link to opportunities
+    is_closed_arr = np.fromiter((case.is_closed for case in cases),
+                                dtype=bool, count=total_cases)
+    closed_cases = int(np.count_nonzero(is_closed_arr))
+    open_cases = total_cases - closed_cases
+    total_comments = sum(_comment_count(v) for v in case_comments.values())
+
+    # Vectorized case ages: parse every timestamp once into datetime64
+    # arrays and subtract in C, instead of running fromisoformat in a
+    # try/except for each case inside the per-opportunity loop.
+    # Salesforce timestamps are truncated to seconds since datetime64
+    # doesn't accept the +0000 offset suffix.
+    created = np.array([(case.created_date or 'NaT')[:19] for case in cases],
+                       dtype='datetime64[s]')
+    closed = np.array([(case.closed_date or case.created_date or 'NaT')[:19]
+                       for case in cases], dtype='datetime64[s]')
+    now64 = np.datetime64(datetime.utcnow().replace(microsecond=0))
+    age_ends = np.where(is_closed_arr, closed, now64)
+    case_ages = (age_ends - created).astype('timedelta64[D]').astype('int64')
+    valid_ages = ~np.isnat(created) & ~np.isnat(age_ends)
+
+    # Group cases by account and accumulate every per-account statistic
+    # in the same pass (row indices alongside the dicts so the age
+    # arrays can be sliced per account). The per-opportunity loop then
+    # just reads these, so shared accounts aren't re-scanned per
+    # opportunity: O(cases) instead of O(opps x account_cases).
     cases_by_account = defaultdict(list)
-    for case in cases:
-        account_id = case['AccountId']
+    case_rows_by_account = defaultdict(list)
+    acct_stats = defaultdict(lambda: {
+        'open': 0,
+        'closed': 0,
+        'comments': 0,
+        'priorities': Counter(),
+        'statuses': Counter(),
+        'types': Counter()
+    })
+    for row, case in enumerate(cases):
+        account_id = case.account_id
         cases_by_account[account_id].append(case)
-    
+        case_rows_by_account[account_id].append(row)
+
+        stats = acct_stats[account_id]
+        stats['comments'] += _comment_count(case_comments.get(case.id, 0))
+        stats['priorities'][case.priority or 'None'] += 1
+        stats['statuses'][case.status or 'None'] += 1
+        stats['types'][case.type or 'None'] += 1
+
+    # Per-account open/closed counts come from the bool array: one
+    # count_nonzero over each account's row indices instead of a
+    # Python branch per case. The index arrays are kept for the age
+    # slicing below so shared accounts build them only once.
+    idx_by_account = {}
+    for account_id, rows in case_rows_by_account.items():
+        idx = np.array(rows, dtype=np.intp)
+        idx_by_account[account_id] = idx
+        closed_n = int(np.count_nonzero(np.take(is_closed_arr, idx)))
+        acct_stats[account_id]['closed'] = closed_n
+        acct_stats[account_id]['open'] = len(rows) - closed_n
+
+    # Convert each account's counters to plain dicts once; opportunities
+    # sharing an account alias the same dicts instead of copying them
+    # per opportunity
+    _empty: Dict[str, int] = {}
+    breakdowns_by_account = {
+        account_id: (dict(stats['priorities']), dict(stats['statuses']),
+                     dict(stats['types']))
+        for account_id, stats in acct_stats.items()
+    }
+
     # Create analysis by opportunity
     by_opportunity = {}
-    
+
     for opp_id, opp_info in opportunities.items():
         account_id = opp_info['account_id']
         account_cases = cases_by_account.get(account_id, [])
+
+        # Read the stats accumulated in the single grouping pass
+        account_stats = acct_stats.get(account_id)
+        if account_stats:
+            opp_open_cases = account_stats['open']
+            opp_closed_cases = account_stats['closed']
+            opp_comments = account_stats['comments']
+            priorities, statuses, types = breakdowns_by_account[account_id]
+        else:
+            opp_open_cases = opp_closed_cases = opp_comments = 0
+            priorities = statuses = types = _empty
+
+        # Slice the precomputed age array for this account's rows
+        idx = idx_by_account.get(account_id)
+        if idx is not None:
+            mask = valid_ages[idx]
+            avg_case_age = float(case_ages[idx][mask].mean()) if mask.any() else 0
+        else:
+            avg_case_age = 0
         
-        # Calculate case stats for this opportunity's account
-        opp_open_cases = sum(1 for case in account_cases if not case['IsClosed'])
-        opp_closed_cases = len(account_cases) - opp_open_cases
-        opp_comments = sum(len(case_comments.get(case['Id'], [])) for case in account_cases)
-        
-        # Get case priorities and statuses
-        priorities = Counter(case.get('Priority', 'None') for case in account_cases)
-        statuses = Counter(case.get('Status', 'None') for case in account_cases)
-        types = Counter(case.get('Type', 'None') for case in account_cases)
-        
-        # Calculate case age stats
-        now = datetime.utcnow()
-        case_ages = []
-        for case in account_cases:
-            try:
-                created = datetime.fromisoformat(case['CreatedDate'].replace('Z', '+00:00').replace('+00:00', ''))
-                if case['IsClosed'] and case['ClosedDate']:
-                    closed = datetime.fromisoformat(case['ClosedDate'].replace('Z', '+00:00').replace('+00:00', ''))
-                    age_days = (closed - created).days
-                else:
-                    age_days = (now - created).days
-                case_ages.append(age_days)
-            except:
-                continue
-        
-        avg_case_age = sum(case_ages) / len(case_ages) if case_ages else 0
-        
+        # Keep only IDs and a trimmed recent-case preview here - embedding
+        # the full case dicts duplicated the raw payload in the output
         by_opportunity[opp_id] = {
             'opportunity_info': opp_info,
-            'cases': account_cases,
+            'case_ids': [case.id for case in account_cases],
+            'recent_cases': [
+                {
+                    'CaseNumber': case.case_number,
+                    'Subject': case.subject,
+                    'Status': case.status,
+                    'Priority': case.priority,
+                    'CreatedDate': case.created_date
+                }
+                # Every fetch path orders by CreatedDate DESC and the
+                # grouping pass preserves that order, so the head of the
+                # per-account list is already the newest - no resort
+                for case in account_cases[:3]
+            ],
             'stats': {
                 'total_cases': len(account_cases),
                 'open_cases': opp_open_cases,
@@ -280,16 +944,21 @@ def analyze_opportunity_cases(opportunities_info: Dict[str, Any], cases: List[Di
                 'close_rate': (opp_closed_cases / len(account_cases) * 100) if account_cases else 0,
                 'total_comments': opp_comments,
                 'avg_case_age_days': avg_case_age,
-                'priorities': dict(priorities),
-                'statuses': dict(statuses),
-                'types': dict(types)
+                'priorities': priorities,
+                'statuses': statuses,
+                'types': types
             }
         }
-    
-    # Overall breakdowns
-    all_priorities = Counter(case.get('Priority', 'None') for case in cases)
-    all_statuses = Counter(case.get('Status', 'None') for case in cases)
-    all_types = Counter(case.get('Type', 'None') for case in cases)
+
+    # Overall breakdowns: sum the per-account counters rather than
+    # re-scanning every case
+    all_priorities = Counter()
+    all_statuses = Counter()
+    all_types = Counter()
+    for stats in acct_stats.values():
+        all_priorities.update(stats['priorities'])
+        all_statuses.update(stats['statuses'])
+        all_types.update(stats['types'])
     
     return {
         'total_cases': total_cases,
@@ -309,107 +978,133 @@ def analyze_opportunity_cases(opportunities_info: Dict[str, Any], cases: List[Di
     }
 
 def display_analysis(analysis: Dict[str, Any]):
-    """Display the opportunity-cases analysis."""
-    
-    print(f"\n🎯 OPPORTUNITY-RELATED CASES ANALYSIS")
-    print("=" * 45)
-    
+    """
+    Display the opportunity-cases analysis.
+
+    The report is buffered into a line list and flushed with a single
+    stdout write - large --file runs were issuing thousands of print
+    syscalls, one per line.
+    """
+
+    out = []
+    out.append(f"\n🎯 OPPORTUNITY-RELATED CASES ANALYSIS")
+    out.append("=" * 45)
+
     stats = analysis['overall_stats']
-    print(f"\n📊 Overall Statistics:")
-    print(f"   Opportunities Analyzed: {analysis['total_opportunities']}")
-    print(f"   Related Cases: {stats['total_cases']:,}")
-    print(f"   Open Cases: {stats['open_cases']:,}")
-    print(f"   Closed Cases: {stats['closed_cases']:,}")
-    print(f"   Case Close Rate: {stats['close_rate']:.1f}%")
-    print(f"   Total Comments: {stats['total_comments']:,}")
-    print(f"   Avg Comments/Case: {stats['avg_comments_per_case']:.1f}")
-    
-    # Priority breakdown
+    out.append(f"\n📊 Overall Statistics:")
+    out.append(f"   Opportunities Analyzed: {analysis['total_opportunities']}")
+    out.append(f"   Related Cases: {stats['total_cases']:,}")
+    out.append(f"   Open Cases: {stats['open_cases']:,}")
+    out.append(f"   Closed Cases: {stats['closed_cases']:,}")
+    out.append(f"   Case Close Rate: {stats['close_rate']:.1f}%")
+    out.append(f"   Total Comments: {stats['total_comments']:,}")
+    out.append(f"   Avg Comments/Case: {stats['avg_comments_per_case']:.1f}")
+
+    # Priority breakdown; divide once instead of per row
     if stats.get('priority_breakdown'):
-        print(f"\n📈 Case Priority Breakdown:")
+        inv_total = 100.0 / stats['total_cases'] if stats['total_cases'] > 0 else 0.0
+        out.append(f"\n📈 Case Priority Breakdown:")
         for priority, count in sorted(stats['priority_breakdown'].items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / stats['total_cases'] * 100) if stats['total_cases'] > 0 else 0
-            print(f"   {priority}: {count:,} ({percentage:.1f}%)")
-    
+            out.append(f"   {priority}: {count:,} ({count * inv_total:.1f}%)")
+
     if not analysis['by_opportunity']:
-        print(f"\n📋 No opportunities with related cases found.")
+        out.append(f"\n📋 No opportunities with related cases found.")
+        sys.stdout.write('\n'.join(out) + '\n')
         return
-    
+
     # Sort opportunities by case count
     sorted_opportunities = sorted(
         analysis['by_opportunity'].items(),
         key=lambda x: x[1]['stats']['total_cases'],
         reverse=True
     )
-    
-    print(f"\n💼 BREAKDOWN BY OPPORTUNITY:")
-    print("=" * 40)
-    
+
+    out.append(f"\n💼 BREAKDOWN BY OPPORTUNITY:")
+    out.append("=" * 40)
+
     for i, (opp_id, data) in enumerate(sorted_opportunities, 1):
         opp_info = data['opportunity_info']
         opp_stats = data['stats']
-        
-        print(f"\n{i}. {opp_info['name']}")
-        print(f"    Opportunity ID: {opp_id}")
-        print(f"    Account: {opp_info['account_name']}")
-        print(f"    Stage: {opp_info['stage']}")
-        
+
+        out.append(f"\n{i}. {opp_info['name']}")
+        out.append(f"    Opportunity ID: {opp_id}")
+        out.append(f"    Account: {opp_info['account_name']}")
+        out.append(f"    Stage: {opp_info['stage']}")
+
         if opp_info['amount']:
-            print(f"    Amount: ${opp_info['amount']:,.2f}")
-        
+            out.append(f"    Amount: ${opp_info['amount']:,.2f}")
+
         if opp_info['close_date']:
-            print(f"    Close Date: {opp_info['close_date']}")
-        
+            out.append(f"    Close Date: {opp_info['close_date']}")
+
         status = "WON" if opp_info['is_won'] else "LOST" if opp_info['is_closed'] else "OPEN"
-        print(f"    Status: {status}")
-        
-        print(f"    Related Cases: {opp_stats['total_cases']} (Open: {opp_stats['open_cases']}, Closed: {opp_stats['closed_cases']})")
-        
+        out.append(f"    Status: {status}")
+
+        out.append(f"    Related Cases: {opp_stats['total_cases']} (Open: {opp_stats['open_cases']}, Closed: {opp_stats['closed_cases']})")
+
         if opp_stats['total_cases'] > 0:
-            print(f"    Case Close Rate: {opp_stats['close_rate']:.1f}%")
-            print(f"    Comments: {opp_stats['total_comments']}")
-            print(f"    Avg Case Age: {opp_stats['avg_case_age_days']:.1f} days")
-            
+            out.append(f"    Case Close Rate: {opp_stats['close_rate']:.1f}%")
+            out.append(f"    Comments: {opp_stats['total_comments']}")
+            out.append(f"    Avg Case Age: {opp_stats['avg_case_age_days']:.1f} days")
+
             # Show top case priorities
             if opp_stats['priorities']:
                 top_priorities = sorted(opp_stats['priorities'].items(), key=lambda x: x[1], reverse=True)
-                print(f"    Case Priorities: {', '.join(f'{p}({c})' for p, c in top_priorities[:3])}")
-            
-            # Show recent cases
-            recent_cases = sorted(data['cases'], key=lambda x: x['CreatedDate'], reverse=True)[:3]
+                out.append(f"    Case Priorities: {', '.join(f'{p}({c})' for p, c in top_priorities[:3])}")
+
+            # Show recent cases (pre-trimmed during analysis)
+            recent_cases = data['recent_cases']
             if recent_cases:
-                print(f"    Recent Cases:")
+                out.append(f"    Recent Cases:")
                 for j, case in enumerate(recent_cases, 1):
                     status = case['Status'] or 'No Status'
                     priority = case['Priority'] or 'No Priority'
                     created = case['CreatedDate'][:10] if case['CreatedDate'] else 'Unknown'
                     subject = case['Subject'][:35] + "..." if case['Subject'] and len(case['Subject']) > 35 else case['Subject']
-                    print(f"      {j}. {case['CaseNumber']} - {subject}")
-                    print(f"         {status} | {priority} | {created}")
+                    out.append(f"      {j}. {case['CaseNumber']} - {subject}")
+                    out.append(f"         {status} | {priority} | {created}")
 
-def save_to_json(analysis: Dict[str, Any], cases: List[Dict[str, Any]], 
-                case_comments: Dict[str, List[Dict[str, Any]]], 
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def save_to_json(analysis: Dict[str, Any], cases: List[CaseRow],
+                case_comments: Dict[str, List[Dict[str, Any]]],
                 opportunities_info: Dict[str, Any], filename: str):
     """Save analysis and data to JSON file."""
     
-    output_data = {
-        'analysis': analysis,
-        'raw_data': {
-            'opportunities': opportunities_info,
-            'cases': cases,
-            'case_comments': case_comments
-        },
-        'metadata': {
-            'generated_at': datetime.utcnow().isoformat(),
-            'total_opportunities': analysis['total_opportunities'],
-            'total_cases': len(cases),
-            'total_comments': sum(len(comments) for comments in case_comments.values())
-        }
+    metadata = {
+        'generated_at': datetime.utcnow().isoformat(),
+        'total_opportunities': analysis['total_opportunities'],
+        'total_cases': len(cases),
+        'total_comments': sum(_comment_count(v) for v in case_comments.values())
     }
-    
-    with open(filename, 'w') as f:
-        json.dump(output_data, f, indent=2, default=str)
-    
+
+    # Write the sections incrementally with orjson: each case is encoded
+    # and flushed on its own, so the full serialized structure is never
+    # held in memory alongside the source dicts
+    opts = orjson.OPT_SERIALIZE_NUMPY
+
+    with open(filename, 'wb') as f:
+        f.write(b'{"analysis":')
+        f.write(orjson.dumps(analysis, option=opts, default=str))
+        f.write(b',"raw_data":{"opportunities":')
+        f.write(orjson.dumps(opportunities_info, option=opts, default=str))
+        # Normalized lookup table: by_opportunity entries carry case_ids
+        # that resolve here, so cases shared by several opportunities
+        # are serialized exactly once. orjson encodes the CaseRow
+        # dataclasses directly (snake_case field names).
+        f.write(b',"cases_by_id":{')
+        for i, case in enumerate(cases):
+            if i:
+                f.write(b',')
+            f.write(orjson.dumps(case.id, option=opts))
+            f.write(b':')
+            f.write(orjson.dumps(case, option=opts, default=str))
+        f.write(b'},"case_comments":')
+        f.write(orjson.dumps(case_comments, option=opts, default=str))
+        f.write(b'},"metadata":')
+        f.write(orjson.dumps(metadata, option=opts, default=str))
+        f.write(b'}')
+
     print(f"\n💾 Data saved to: {filename}")
 
 def main():
@@ -430,62 +1125,84 @@ def main():
     parser.add_argument('--date-from', help='Filter cases created from date (YYYY-MM-DD)')
     parser.add_argument('--date-to', help='Filter cases created to date (YYYY-MM-DD)')
     parser.add_argument('--limit', type=int, help='Limit number of cases returned')
-    
+    parser.add_argument('--bulk', action='store_true',
+                        help='Pull cases via Bulk API 2.0 (auto-enabled for many accounts without --limit)')
+    parser.add_argument('--stats-only', action='store_true',
+                        help='Compute statistics via GROUP BY aggregates without downloading case rows')
+
     # Output
     parser.add_argument('--output', help='Output JSON filename')
     parser.add_argument('--no-comments', action='store_true', help='Skip case comments retrieval')
+    parser.add_argument('--include-descriptions', action='store_true',
+                        help='Fetch case Description text (omitted by default to shrink payloads)')
+    parser.add_argument('--include-comment-bodies', action='store_true',
+                        help='Fetch full comment bodies instead of per-case counts')
+    parser.add_argument('--refresh-session', action='store_true',
+                        help='Discard any cached Salesforce session and re-authenticate')
+    parser.add_argument('--accounts-file',
+                        help='CSV of opp_id,account_id,account_name to skip the opportunity lookup')
+    parser.add_argument('--dump-accounts', metavar='FILE',
+                        help='Write the opp_id,account_id,account_name CSV for later --accounts-file runs')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Skip the on-disk opportunity/account lookup cache')
+    parser.add_argument('--cache-ttl-hours', type=float, default=24,
+                        help='How long cached opportunity lookups stay valid (default: 24)')
     
     args = parser.parse_args()
     
     # Get opportunity URLs/IDs
     opportunity_urls = args.opportunity_urls or []
+    file_ids: List[str] = []
     if args.opportunities_file:
         if not os.path.exists(args.opportunities_file):
             print(f"Error: File '{args.opportunities_file}' does not exist.")
             sys.exit(1)
-        
+
+        # Harvest every ID from the file in a single regex pass instead
+        # of running extract_opportunity_id per line; comment lines are
+        # dropped first so IDs mentioned in them don't leak in
         with open(args.opportunities_file, 'r') as f:
-            file_urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            opportunity_urls.extend(file_urls)
-    
-    if not opportunity_urls:
+            text = '\n'.join(line for line in f.read().splitlines()
+                             if not line.lstrip().startswith('#'))
+
+        file_ids = list(dict.fromkeys(_OPP_ID_SCAN.findall(text)))
+        if not file_ids:
+            # Fall back to per-line extraction for unrecognized formats
+            opportunity_urls.extend(line.strip() for line in text.splitlines()
+                                    if line.strip())
+
+    if not opportunity_urls and not file_ids:
         parser.print_help()
         print(f"\nError: Must provide opportunity URLs or --file parameter")
         sys.exit(1)
     
-    # Connect to Salesforce
+    # Connect to Salesforce (cached per process unless a refresh is
+    # explicitly requested)
     try:
+        if args.refresh_session:
+            get_salesforce_connection.cache_clear()
         sf = get_salesforce_connection()
         print(f"✅ Connected to Salesforce")
     except Exception as e:
         print(f"❌ Failed to connect to Salesforce: {str(e)}")
         sys.exit(1)
     
-    # Extract opportunity IDs
-    opportunity_ids = []
+    # Extract opportunity IDs (file IDs were already harvested)
+    opportunity_ids = list(file_ids)
     for url in opportunity_urls:
         opp_id = extract_opportunity_id(url)
         if opp_id:
             opportunity_ids.append(opp_id)
         else:
             print(f"⚠️  Invalid opportunity URL: {url}")
-    
+    opportunity_ids = list(dict.fromkeys(opportunity_ids))
+
     if not opportunity_ids:
         print(f"❌ No valid opportunity IDs found")
         sys.exit(1)
     
     print(f"🔍 Analyzing cases related to {len(opportunity_ids)} opportunity(ies)")
-    
-    # Get opportunity information and account IDs
-    opportunities_info = get_opportunities_info(sf, opportunity_ids)
-    account_ids = opportunities_info.get('account_ids', [])
-    
-    if not account_ids:
-        print(f"❌ No accounts found for the specified opportunities")
-        sys.exit(1)
-    
-    print(f"✅ Found {len(account_ids)} related accounts")
-    
+
     # Build filters
     filters = {
         'open_only': args.open_only,
@@ -495,22 +1212,75 @@ def main():
         'type': args.type,
         'date_from': args.date_from,
         'date_to': args.date_to,
-        'limit': args.limit
+        'limit': args.limit,
+        'include_descriptions': args.include_descriptions,
+        'include_comments': not args.no_comments,
+        'include_comment_bodies': args.include_comment_bodies
     }
-    
-    # Get cases for the related accounts
-    cases = get_cases_for_accounts(sf, account_ids, filters)
-    
+
+    # One combined round-trip fetches opportunities, accounts and cases
+    # together (skipped under --bulk, which pulls cases via the Bulk API,
+    # and under --stats-only, which never downloads rows at all)
+    cases = None
+    case_comments = None
+    if args.accounts_file:
+        # A caller-provided mapping removes the opportunity-resolution
+        # round-trip entirely; only cases are fetched
+        opportunities_info = _load_accounts_file(args.accounts_file)
+    elif not args.bulk and not args.stats_only:
+        combined = get_opportunities_and_cases(sf, opportunity_ids, filters)
+        if combined:
+            opportunities_info, cases = combined
+
+    if cases is None and not args.accounts_file:
+        # Fallback: the original two-step flow (disk-cached lookups,
+        # unless disabled)
+        cache_ttl = None if args.no_cache else int(args.cache_ttl_hours * 3600)
+        opportunities_info = get_opportunities_info(sf, opportunity_ids,
+                                                    cache_ttl_seconds=cache_ttl)
+
+    account_ids = opportunities_info.get('account_ids', [])
+
+    if not account_ids:
+        print(f"❌ No accounts found for the specified opportunities")
+        sys.exit(1)
+
+    print(f"✅ Found {len(account_ids)} related accounts")
+
+    if args.dump_accounts:
+        _dump_accounts_file(args.dump_accounts, opportunities_info)
+
+    if args.stats_only:
+        # Server-side aggregates: no case rows, no comments
+        acct_stats = get_case_stats_for_accounts(sf, account_ids, filters)
+        analysis = analyze_from_stats(opportunities_info, acct_stats)
+        display_analysis(analysis)
+
+        if args.output:
+            save_to_json(analysis, [], {}, opportunities_info, args.output)
+        return
+
+    if cases is None:
+        # Get cases for the related accounts; unbounded pulls over many
+        # accounts go through the Bulk API automatically. The REST path
+        # returns comments inline via the child subquery
+        use_bulk = args.bulk or (len(account_ids) > 20 and not args.limit)
+        cases, case_comments = get_cases_for_accounts(sf, account_ids, filters,
+                                                      use_bulk=use_bulk)
+
     if not cases:
         print(f"📋 No cases found for the opportunity-related accounts")
         print(f"💡 These opportunities may not have any associated customer service cases")
         return
-    
-    # Get case comments
-    case_comments = {}
-    if not args.no_comments and cases:
-        case_ids = [case['Id'] for case in cases]
-        case_comments = get_case_comments(sf, case_ids)
+
+    # Get case comments, unless they already arrived inline with the
+    # cases (combined and bulk paths can't embed the subquery)
+    if case_comments is None:
+        case_comments = {}
+        if not args.no_comments:
+            case_ids = [case.id for case in cases]
+            case_comments = get_case_comments(sf, case_ids,
+                                              include_bodies=args.include_comment_bodies)
     
     # Analyze data
     analysis = analyze_opportunity_cases(opportunities_info, cases, case_comments)
@@ -6,8 +6,9 @@ This script queries Salesforce opportunities and ingests the data into Elasticse
 It uses the sf_auth module for authentication and retrieves specific opportunity fields.
 
 Usage:
-    python sf_to_elasticsearch.py <opportunity_url>
-    
+    python sf_to_elasticsearch.py <opportunity_url> [<opportunity_url> ...]
+    python sf_to_elasticsearch.py --urls-file opportunities.txt
+
 Example:
     python sf_to_elasticsearch.py "https://elastic.lightning.force.com/lightning/r/Opportunity/0064R00000XXXXXX/view"
 """
@@ -17,127 +18,280 @@ import re
 import json
 import logging
 import os
+import argparse
+import atexit
+import queue
+import shelve
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from urllib.parse import urlparse
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, List, Any
 
 # Add current directory to path for config import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from elasticsearch import Elasticsearch
+import orjson
+from elasticsearch import Elasticsearch, helpers
 from elasticsearch.exceptions import ConnectionError, AuthenticationException, RequestError
+from elasticsearch.serializer import JsonSerializer
 from sf_auth import get_salesforce_connection
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('sf_to_es.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Configure logging. Records pass through a queue to a background
+# listener thread, so the file/stream writes never block the indexing
+# path - under batched loads synchronous log I/O was a per-document
+# disk write.
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler('sf_to_es.log')
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+# The queue handler only flattens the message; the listener's handlers
+# apply the real format
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[QueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # Elasticsearch configuration
 ES_CONFIG = None  # Will be set interactively
 
+# Salesforce opportunity ID: 15 or 18 characters starting with the 006
+# key prefix, ending at a URL delimiter. One anchored pattern compiled
+# at import replaces the old three-pattern loop whose generic first
+# pattern matched non-opportunity IDs that then failed the prefix check.
+_OPP_RE = re.compile(r'(006[A-Za-z0-9]{12,15})(?:[/?#]|$)')
+
+# Strict whitelist for IDs interpolated into SOQL. Salesforce IDs are
+# purely alphanumeric, so anything else is rejected outright - this
+# both prevents injection and keeps the IN-list query shape fixed so
+# Salesforce can reuse the cached query plan across runs.
+_SOQL_ID_RE = re.compile(r'[A-Za-z0-9]{15,18}')
+
+def _sanitize(opportunity_id: str) -> str:
+    """Validate an ID for safe SOQL interpolation; raise if malformed."""
+    if not _SOQL_ID_RE.fullmatch(opportunity_id):
+        raise ValueError(f"Invalid Salesforce ID: {opportunity_id!r}")
+    return opportunity_id
+
 def extract_opportunity_id(url: str) -> Optional[str]:
     """
     Extract Salesforce Opportunity ID from URL.
-    
+
     Args:
         url: Salesforce opportunity URL
-        
+
     Returns:
         Opportunity ID or None if not found
     """
-    # Pattern for Salesforce opportunity ID (15 or 18 characters starting with 006)
-    patterns = [
-        r'/([A-Za-z0-9]{15,18})',  # Generic ID pattern
-        r'/Opportunity/([A-Za-z0-9]{15,18})',  # Explicit opportunity pattern
-        r'006[A-Za-z0-9]{12,15}',  # Opportunity-specific pattern
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            opportunity_id = match.group(1) if len(match.groups()) > 0 else match.group(0)
-            # Ensure it starts with 006 (Opportunity prefix)
-            if opportunity_id.startswith('006') and len(opportunity_id) >= 15:
-                return opportunity_id
-    
+    # Fast path: scan the URL path segments with plain string ops; for
+    # the fixed .../Opportunity/006.../view shape this avoids spinning
+    # up the regex engine at all
+    for part in urlparse(url).path.split('/'):
+        if part.startswith('006') and 15 <= len(part) <= 18 and part.isalnum():
+            return part
+
+    # Fallback for IDs embedded in query strings or fragments
+    match = _OPP_RE.search(url)
+    if match:
+        return match.group(1)
+
     logger.error(f"Could not extract opportunity ID from URL: {url}")
     return None
 
-def query_opportunity_data(sf, opportunity_id: str) -> Optional[Dict[str, Any]]:
+# Sidecar store of the last-seen SystemModstamp per opportunity, so
+# cron-style re-runs skip re-indexing documents that haven't changed
+_WATERMARK_PATH = 'sf_to_es_watermark'
+
+def iter_opportunities(sf, opportunity_ids: List[str],
+                       skip_unchanged: bool = True,
+                       stats: Optional[Dict[str, int]] = None):
     """
-    Query Salesforce for opportunity data.
-    
+    Yield opportunity documents for the given IDs, page by page.
+
+    One IN-list query per 200 IDs replaces the old one-query-per-
+    opportunity flow, and query_all_iter pages records lazily via
+    nextRecordsUrl. As a generator this chains straight into the bulk
+    indexer, so memory stays at one Salesforce page regardless of
+    batch size.
+
+    With skip_unchanged (the default), each record's SystemModstamp is
+    compared against a local shelve watermark and unchanged documents
+    are dropped before they reach Elasticsearch - re-indexing an
+    unmodified doc is pure wasted Lucene work. The watermark is only
+    read here; the caller persists it via _commit_watermarks once the
+    bulk response confirms which documents actually landed.
+
     Args:
         sf: Authenticated Salesforce connection
-        opportunity_id: Salesforce opportunity ID
-        
+        opportunity_ids: Salesforce opportunity IDs
+        skip_unchanged: Skip documents whose SystemModstamp hasn't moved
+        stats: Optional dict that receives a 'skipped' count and a
+            'modstamps' dict of yielded ID -> SystemModstamp, since a
+            generator can't return them to the consumer directly
+
+    Yields:
+        Opportunity document dicts ready for indexing
+    """
+    # The orjson serializer encodes datetimes directly; no isoformat step
+    extracted_at = datetime.utcnow()
+    found = set()
+    skipped = 0
+    modstamps: Dict[str, str] = {}
+    opportunity_ids = [_sanitize(opp_id) for opp_id in opportunity_ids]
+
+    watermarks = shelve.open(_WATERMARK_PATH) if skip_unchanged else None
+    try:
+        for i in range(0, len(opportunity_ids), 200):
+            ids_str = "','".join(opportunity_ids[i:i + 200])
+            soql_query = f"""
+            SELECT
+                Id,
+                Name,
+                Account.Name,
+                CloseDate,
+                Amount,
+                TCV__c,
+                SystemModstamp
+            FROM Opportunity
+            WHERE Id IN ('{ids_str}')
+            """
+
+            logger.info("Querying Salesforce for %d opportunity(ies)",
+                        min(200, len(opportunity_ids) - i))
+
+            for opportunity in sf.query_all_iter(soql_query):
+                found.add(opportunity['Id'])
+
+                modstamp = opportunity.get('SystemModstamp')
+                if watermarks is not None and modstamp \
+                        and watermarks.get(opportunity['Id']) == modstamp:
+                    skipped += 1
+                    continue
+
+                yield {
+                    'opportunity_id': opportunity['Id'],
+                    'opportunity_name': opportunity['Name'],
+                    'account_name': opportunity['Account']['Name'] if opportunity.get('Account') else None,
+                    'close_date': opportunity['CloseDate'],
+                    'amount': opportunity['Amount'],
+                    'tcv_amount': opportunity.get('TCV__c'),
+                    'system_modstamp': modstamp,
+                    'extracted_at': extracted_at,
+                    'source': 'salesforce'
+                }
+
+                if modstamp:
+                    modstamps[opportunity['Id']] = modstamp
+    finally:
+        if watermarks is not None:
+            watermarks.close()
+
+    for opportunity_id in set(opportunity_ids) - found:
+        logger.error(f"No opportunity found with ID: {opportunity_id}")
+
+    if skipped:
+        logger.info("Skipped %d unchanged opportunity(ies)", skipped)
+    if stats is not None:
+        stats['skipped'] = skipped
+        stats['modstamps'] = modstamps
+    logger.info("Retrieved %d of %d opportunities",
+                len(found), len(opportunity_ids))
+
+def _commit_watermarks(opportunity_ids: List[str],
+                       modstamps: Dict[str, str]) -> None:
+    """
+    Persist SystemModstamp watermarks for successfully indexed docs.
+
+    Called only after the bulk response confirms which documents
+    landed - writing a watermark any earlier would let a failed or
+    interrupted load mark documents as done, and subsequent runs would
+    silently skip records that were never indexed.
+    """
+    stamps = {opp_id: modstamps[opp_id]
+              for opp_id in opportunity_ids if modstamps.get(opp_id)}
+    if not stamps:
+        return
+    watermarks = shelve.open(_WATERMARK_PATH)
+    try:
+        watermarks.update(stamps)
+    finally:
+        watermarks.close()
+
+def query_opportunities(sf, opportunity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Query Salesforce for a batch of opportunities.
+
+    Materialized convenience wrapper over iter_opportunities for
+    callers that need random access by ID.
+
     Returns:
-        Dictionary with opportunity data or None if not found
+        Dictionary of opportunity data keyed by opportunity ID
     """
     try:
-        # SOQL query to get required fields
-        soql_query = f"""
-        SELECT 
-            Id,
-            Name,
-            Account.Name,
-            CloseDate,
-            Amount,
-            TCV__c
-        FROM Opportunity 
-        WHERE Id = '{opportunity_id}'
-        """
-        
-        logger.info(f"Querying Salesforce for opportunity: {opportunity_id}")
-        result = sf.query(soql_query)
-        
-        if result['totalSize'] == 0:
-            logger.error(f"No opportunity found with ID: {opportunity_id}")
-            return None
-            
-        opportunity = result['records'][0]
-        
-        # Extract and format the data
-        data = {
-            'opportunity_id': opportunity['Id'],
-            'opportunity_name': opportunity['Name'],
-            'account_name': opportunity['Account']['Name'] if opportunity.get('Account') else None,
-            'close_date': opportunity['CloseDate'],
-            'amount': opportunity['Amount'],
-            'tcv_amount': opportunity.get('TCV__c'),
-            'extracted_at': datetime.utcnow().isoformat(),
-            'source': 'salesforce'
-        }
-        
-        logger.info(f"Successfully retrieved opportunity data: {data['opportunity_name']}")
-        return data
-        
+        return {doc['opportunity_id']: doc
+                for doc in iter_opportunities(sf, opportunity_ids,
+                                              skip_unchanged=False)}
     except Exception as e:
         logger.error(f"Error querying Salesforce: {str(e)}")
-        return None
+        return {}
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    orjson-backed request/response serializer.
+
+    Cuts the JSON encode/decode CPU on every bulk chunk and encodes
+    datetime objects natively (as UTC with a Z suffix), so documents
+    can carry datetimes without a manual isoformat step.
+    """
+
+    def dumps(self, data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+# Process-wide Elasticsearch client; repeated connect calls reuse the
+# same keep-alive sockets instead of paying a TCP+TLS handshake each
+# time. sf_auth caches the Salesforce connection the same way.
+_ES_CLIENT: Optional[Elasticsearch] = None
 
 def connect_elasticsearch(es_config: Dict[str, Any]) -> Optional[Elasticsearch]:
     """
-    Create Elasticsearch connection.
-    
+    Create Elasticsearch connection, reusing any existing client.
+
     Args:
         es_config: Dictionary with Elasticsearch configuration
-    
+
     Returns:
         Elasticsearch client or None if connection fails
     """
+    global _ES_CLIENT
+    if _ES_CLIENT is not None:
+        return _ES_CLIENT
+
     try:
         # Prepare connection parameters
         connection_params = {
             'verify_certs': es_config.get('verify_certs', False),
-            'request_timeout': 30
+            'request_timeout': 30,
+            # Give the urllib3 pool one socket per parallel_bulk worker
+            # so the bulk threads don't queue on connections
+            'connections_per_node': es_config.get('parallelism', 12),
+            # Back off and retry instead of erroring out when the
+            # cluster sheds load (429) or a node blips (502/503/504)
+            'retry_on_timeout': True,
+            'max_retries': 5,
+            'retry_on_status': (429, 502, 503, 504),
+            'serializer': OrjsonSerializer(),
+            # Opportunity JSON is highly repetitive (same keys every
+            # doc) and compresses well; gzipping bulk bodies cuts
+            # bytes-on-wire several-fold
+            'http_compress': True
         }
         
         # Add authentication
@@ -151,9 +305,11 @@ def connect_elasticsearch(es_config: Dict[str, Any]) -> Optional[Elasticsearch]:
             **connection_params
         )
         
-        # Test connection
-        info = es.info()
+        # Test connection; only the cluster name is needed from the
+        # info envelope
+        info = es.info(filter_path=['name'])
         logger.info(f"Connected to Elasticsearch cluster: {info['name']}")
+        _ES_CLIENT = es
         return es
         
     except ConnectionError:
@@ -166,58 +322,140 @@ def connect_elasticsearch(es_config: Dict[str, Any]) -> Optional[Elasticsearch]:
         logger.error(f"Unexpected error connecting to Elasticsearch: {str(e)}")
         return None
 
-def index_document(es: Elasticsearch, data: Dict[str, Any], es_config: Dict[str, Any]) -> bool:
+def index_documents(es: Elasticsearch, docs, es_config: Dict[str, Any],
+                    bulk_mode: bool = False,
+                    successful_ids: Optional[List[str]] = None) -> int:
     """
-    Index document in Elasticsearch.
-    
+    Bulk-index documents in Elasticsearch.
+
+    One _bulk request per 500 documents replaces the old per-document
+    es.index call, amortizing the HTTP round-trip across the whole
+    chunk. Accepts any iterable of document dicts, including
+    generators. With bulk_mode=True, refresh and replication are
+    suspended for the duration of the load and restored afterwards -
+    the standard backfill tuning for large batches.
+
     Args:
         es: Elasticsearch client
-        data: Document data to index
+        docs: Iterable of document data to index
         es_config: Elasticsearch configuration
-        
+        bulk_mode: Suspend refresh/replicas during the load
+        successful_ids: Optional list that receives the document ID of
+            every confirmed item, so the caller can commit watermarks
+            for exactly the documents that landed
+
     Returns:
-        True if successful, False otherwise
+        Number of successfully indexed documents
     """
+    if bulk_mode:
+        index_name = es_config['index']
+        es.indices.put_settings(index=index_name, body={
+            'index': {'refresh_interval': '-1', 'number_of_replicas': 0}
+        })
+        try:
+            return index_documents(es, docs, es_config,
+                                   successful_ids=successful_ids)
+        finally:
+            es.indices.put_settings(index=index_name, body={
+                'index': {
+                    'refresh_interval': es_config.get('refresh_interval', '5s'),
+                    'number_of_replicas': es_config.get('replicas', 1)
+                }
+            })
+    # Use opportunity_id as document ID to prevent duplicates. The op
+    # type must stay index (upsert semantics): the watermark lets
+    # modified records through precisely so they overwrite the stored
+    # document, which a create op would reject with a 409 instead.
+    actions = (
+        {
+            '_op_type': 'index',
+            '_index': es_config['index'],
+            '_id': data['opportunity_id'],
+            '_source': data
+        }
+        for data in docs
+    )
+
     try:
-        # Use opportunity_id as document ID to prevent duplicates
-        doc_id = data['opportunity_id']
-        
-        response = es.index(
-            index=es_config['index'],
-            id=doc_id,
-            body=data
+        # parallel_bulk streams chunks from a thread pool so several
+        # _bulk requests are in flight at once, keeping the cluster's
+        # indexing threads busy instead of waiting on one connection.
+        # The longer bulk timeout goes on the client via .options() -
+        # per-request transport kwargs are deprecated in 8.x
+        results = helpers.parallel_bulk(
+            es.options(request_timeout=60), actions,
+            thread_count=es_config.get('parallelism', 12),
+            chunk_size=500,
+            queue_size=4,
+            raise_on_error=False,
+            # Trim each _bulk response to the fields the result loop
+            # reads - per-item status envelopes dominate response size
+            filter_path=['errors', 'items.*.status', 'items.*._id',
+                         'items.*.error']
         )
-        
-        logger.info(f"Document indexed successfully: {response['_id']} (result: {response['result']})")
-        return True
-        
-    except RequestError as e:
-        logger.error(f"Elasticsearch indexing error: {str(e)}")
-        return False
+        success = 0
+        for ok, item in results:
+            if ok:
+                success += 1
+                if successful_ids is not None:
+                    successful_ids.append(next(iter(item.values()))['_id'])
+            else:
+                logger.error(f"Elasticsearch indexing error: {item}")
+        logger.info("Bulk indexed %d document(s)", success)
+        return success
+
     except Exception as e:
-        logger.error(f"Unexpected error during indexing: {str(e)}")
-        return False
+        logger.error(f"Unexpected error during bulk indexing: {str(e)}")
+        return 0
+
+def index_document(es: Elasticsearch, data: Dict[str, Any], es_config: Dict[str, Any]) -> bool:
+    """Index a single document; thin wrapper over the bulk path."""
+    return index_documents(es, [data], es_config) == 1
+
+# Indices verified this process; repeat calls skip the exists round-trip
+_indices_verified: set = set()
 
 def create_index_if_not_exists(es: Elasticsearch, es_config: Dict[str, Any]) -> bool:
     """
     Create index with appropriate mapping if it doesn't exist.
-    
+
+    The check is memoized per process - an index verified once isn't
+    re-checked on every batch a long-running caller pushes through.
+
     Args:
         es: Elasticsearch client
         es_config: Elasticsearch configuration
-        
+
     Returns:
         True if index exists or was created successfully
     """
     index_name = es_config['index']
-    
+
+    if index_name in _indices_verified:
+        return True
+
     try:
         if es.indices.exists(index=index_name):
             logger.info(f"Index '{index_name}' already exists")
+            _indices_verified.add(index_name)
             return True
             
-        # Define mapping for the index
+        # Define mapping for the index. The settings block trades a
+        # little refresh latency and fsync durability for indexing
+        # throughput: a 5s refresh and async translog cut segment churn
+        # and fsync IOPS compared to the 1s/request-durability defaults.
         mapping = {
+            "settings": {
+                "index": {
+                    "refresh_interval": es_config.get("refresh_interval", "5s"),
+                    "number_of_replicas": es_config.get("replicas", 1),
+                    "translog": {
+                        "durability": "async",
+                        "sync_interval": "30s",
+                        "flush_threshold_size": "1gb"
+                    }
+                }
+            },
             "mappings": {
                 "properties": {
                     "opportunity_id": {"type": "keyword"},
@@ -226,6 +464,7 @@ def create_index_if_not_exists(es: Elasticsearch, es_config: Dict[str, Any]) ->
                     "close_date": {"type": "date"},
                     "amount": {"type": "double"},
                     "tcv_amount": {"type": "double"},
+                    "system_modstamp": {"type": "date"},
                     "extracted_at": {"type": "date"},
                     "source": {"type": "keyword"}
                 }
@@ -234,78 +473,146 @@ def create_index_if_not_exists(es: Elasticsearch, es_config: Dict[str, Any]) ->
         
         es.indices.create(index=index_name, body=mapping)
         logger.info(f"Created index '{index_name}' with mapping")
+        _indices_verified.add(index_name)
         return True
         
     except Exception as e:
         logger.error(f"Error creating index: {str(e)}")
         return False
 
+class Pipeline:
+    """
+    Reusable Salesforce-to-Elasticsearch pipeline.
+
+    Holds the Salesforce connection, the Elasticsearch client, and the
+    verified index across calls, so a long-running caller pays
+    authentication, TLS handshakes, and the index check once instead
+    of per URL. The one-shot CLI is a thin wrapper around run_many.
+    """
+
+    def __init__(self, es_config: Optional[Dict[str, Any]] = None):
+        self.es_config = es_config
+        self.sf = None
+        self.es = None
+
+    def connect(self):
+        """Resolve config and open both connections, idempotently."""
+        if self.es_config is None:
+            from config import get_elasticsearch_config, validate_es_config
+            es_config = get_elasticsearch_config()
+            is_valid, error_msg = validate_es_config(es_config)
+            if not is_valid:
+                raise ValueError(f"Invalid configuration: {error_msg}")
+            self.es_config = es_config
+
+        if self.sf is None:
+            self.sf = get_salesforce_connection()
+            logger.info("Successfully connected to Salesforce")
+
+        if self.es is None:
+            es = connect_elasticsearch(self.es_config)
+            if not es:
+                raise ConnectionError("Failed to connect to Elasticsearch")
+            if not create_index_if_not_exists(es, self.es_config):
+                raise RuntimeError("Failed to create or verify Elasticsearch index")
+            self.es = es
+
+    def run_many(self, opportunity_urls: List[str]):
+        """
+        Extract, query, and index a batch of opportunity URLs.
+
+        Returns:
+            Tuple of (indexed count, extracted ID count)
+        """
+        self.connect()
+
+        opportunity_ids = list(dict.fromkeys(
+            opp_id for opp_id in (extract_opportunity_id(url) for url in opportunity_urls)
+            if opp_id))
+        if not opportunity_ids:
+            logger.error("Failed to extract any opportunity IDs from the URLs")
+            return 0, 0
+
+        # Stream opportunity records from Salesforce straight into the
+        # bulk indexer - nothing is materialized in between. Unchanged
+        # documents dropped by the watermark count as handled.
+        stats = {'skipped': 0}
+        successful_ids: List[str] = []
+        indexed = index_documents(
+            self.es,
+            iter_opportunities(self.sf, opportunity_ids, stats=stats),
+            self.es_config,
+            successful_ids=successful_ids)
+        # Watermarks are committed only for documents the bulk response
+        # confirmed; failed or rejected ones stay unmarked and are
+        # retried on the next run
+        _commit_watermarks(successful_ids, stats.get('modstamps', {}))
+        return indexed + stats['skipped'], len(opportunity_ids)
+
+    def watch(self, stream=sys.stdin):
+        """
+        Index opportunity URLs as they arrive on a stream, one per line.
+
+        Lets an external watcher pipe URLs in over a FIFO or stdin
+        without restarting the process (and re-paying connection setup)
+        per URL. Blank lines and '#' comments are skipped.
+        """
+        self.connect()
+        logger.info("Watching for opportunity URLs...")
+        for line in stream:
+            url = line.strip()
+            if not url or url.startswith('#'):
+                continue
+            indexed, requested = self.run_many([url])
+            if indexed < requested:
+                logger.error(f"Failed to index: {url}")
+
 def main():
     """Main execution function."""
-    if len(sys.argv) != 2:
-        print("Usage: python sf_to_elasticsearch.py <opportunity_url>")
-        print("Example: python sf_to_elasticsearch.py 'https://elastic.lightning.force.com/lightning/r/Opportunity/0064R00000XXXXXX/view'")
+    parser = argparse.ArgumentParser(description='Index Salesforce opportunities into Elasticsearch')
+    parser.add_argument('opportunity_urls', nargs='*', help='Opportunity URLs to index')
+    parser.add_argument('--urls-file', help='File containing opportunity URLs (one per line)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Read opportunity URLs from stdin as they arrive, one per line')
+    args = parser.parse_args()
+
+    opportunity_urls = list(args.opportunity_urls)
+    if args.urls_file:
+        if not os.path.exists(args.urls_file):
+            logger.error(f"URLs file does not exist: {args.urls_file}")
+            sys.exit(1)
+        with open(args.urls_file, 'r') as f:
+            opportunity_urls.extend(
+                line.strip() for line in f
+                if line.strip() and not line.startswith('#'))
+
+    if not opportunity_urls and not args.watch:
+        parser.print_help()
         sys.exit(1)
-    
-    opportunity_url = sys.argv[1]
-    logger.info(f"Processing opportunity URL: {opportunity_url}")
-    
-    # Step 0: Get Elasticsearch configuration
-    from config import get_elasticsearch_config, validate_es_config
-    
+
+    pipeline = Pipeline()
+
     try:
-        es_config = get_elasticsearch_config()
-        is_valid, error_msg = validate_es_config(es_config)
-        if not is_valid:
-            logger.error(f"Invalid configuration: {error_msg}")
-            sys.exit(1)
+        if args.watch:
+            pipeline.watch()
+            return
+
+        logger.info("Processing %d opportunity URL(s)", len(opportunity_urls))
+        indexed, requested = pipeline.run_many(opportunity_urls)
     except KeyboardInterrupt:
-        print("\nConfiguration cancelled by user.")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"Error getting configuration: {str(e)}")
-        sys.exit(1)
-    
-    # Step 1: Extract opportunity ID from URL
-    opportunity_id = extract_opportunity_id(opportunity_url)
-    if not opportunity_id:
-        logger.error("Failed to extract opportunity ID from URL")
+        print("\nCancelled by user.")
         sys.exit(1)
-    
-    # Step 2: Connect to Salesforce
-    try:
-        sf = get_salesforce_connection()
-        logger.info("Successfully connected to Salesforce")
     except Exception as e:
-        logger.error(f"Failed to connect to Salesforce: {str(e)}")
-        sys.exit(1)
-    
-    # Step 3: Query opportunity data
-    opportunity_data = query_opportunity_data(sf, opportunity_id)
-    if not opportunity_data:
-        logger.error("Failed to retrieve opportunity data from Salesforce")
+        logger.error(str(e))
         sys.exit(1)
-    
-    # Step 4: Connect to Elasticsearch
-    es = connect_elasticsearch(es_config)
-    if not es:
-        logger.error("Failed to connect to Elasticsearch")
-        sys.exit(1)
-    
-    # Step 5: Create index if it doesn't exist
-    if not create_index_if_not_exists(es, es_config):
-        logger.error("Failed to create or verify Elasticsearch index")
-        sys.exit(1)
-    
-    # Step 6: Index the document
-    if index_document(es, opportunity_data, es_config):
-        logger.info("Successfully processed opportunity and indexed to Elasticsearch")
-        print(f"\nSuccess! Opportunity '{opportunity_data['opportunity_name']}' has been indexed to Elasticsearch.")
-        print(f"Document ID: {opportunity_data['opportunity_id']}")
-        print(f"Index: {es_config['index']}")
-        print(f"Cluster: {es_config['cluster_url']}")
-    else:
-        logger.error("Failed to index document to Elasticsearch")
+
+    if indexed:
+        logger.info("Successfully indexed %d opportunity(ies) to Elasticsearch", indexed)
+        print(f"\nSuccess! {indexed} opportunity(ies) indexed to Elasticsearch.")
+        print(f"Index: {pipeline.es_config['index']}")
+        print(f"Cluster: {pipeline.es_config['cluster_url']}")
+    if indexed < requested or not requested:
+        logger.error("Failed to index %d document(s)", requested - indexed)
         sys.exit(1)
 
 if __name__ == "__main__":